@@ -4,139 +4,757 @@ Reddit CLI Tool
 A command-line interface for posting to Reddit subreddits and retrieving responses.
 """
 
+from __future__ import annotations
+
 import argparse
+import collections
+import contextlib
+import copy
+import functools
+import io
+import itertools
 import json
+import logging
 import os
+import queue
+import random
+import re
+import shlex
+import socket
+import struct
 import sys
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+    import praw
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from praw.models import Submission, Comment
+    from praw.exceptions import RedditAPIException, ClientException
+    from prawcore.exceptions import TooManyRequests
+
+log = logging.getLogger("reddit_cli")
+
+REDDIT_URL = "https://reddit.com"
+DEFAULT_SOCKET_PATH = os.path.join(os.path.expanduser("~"), ".reddit_cli.sock")
+SUBMISSION_ID_PATTERN = re.compile(r"/comments/([a-z0-9]+)")
+COMMENT_ID_PATTERN = re.compile(r"/comments/[^/]+/[^/]+/([a-z0-9]+)")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+STATE_FILE = os.path.join(os.path.expanduser("~"), ".reddit_cli_state.json")
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".reddit_cli_cache.sqlite")
+CACHE_VERSION = 4  # Bump when the shape of cached results changes
+DEFAULT_RETRY_DELAY = 5  # seconds
+MIN_RETRY_DELAY = 1
+MAX_RETRY_DELAY = 60
+RETRY_DELAY_LEARNING_RATE = 0.3
+MAX_BACKOFF = 30  # seconds, cap for backoff when Reddit gives no wait time
+PACING_THRESHOLD = 100  # Start spacing requests out below this many left in the window
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 300  # seconds
+SUBMISSION_CACHE_SIZE = 128
+SUBMISSION_CACHE_TTL = 60  # seconds, posts change faster than listings are re-read
+LISTING_PAGE_SIZE = 100  # Items Reddit returns per listing request
+COMMENT_SCAN_FACTOR = 50  # Comments scanned per wanted match when searching locally
+RATELIMIT_WAIT_PATTERN = re.compile(r"(\d+)\s*(milliseconds?|seconds?|minutes?)", re.IGNORECASE)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when Reddit asks for a longer wait than we are willing to sleep."""
+    
+    def __init__(self, wait_seconds: float):
+        super().__init__(f"Rate limit exceeded. Try again in {wait_seconds:.0f} seconds.")
+        self.wait_seconds = wait_seconds
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Log handler that always writes to the current ``sys.stderr``.
+    
+    A plain StreamHandler keeps the stream it was created with, which would
+    bypass the stderr redirection used to capture daemon command output.
+    """
+    
+    def __init__(self):
+        super().__init__(sys.stderr)
+    
+    @property
+    def stream(self):
+        return sys.stderr
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def configure_logging(quiet: bool = False, verbose: bool = False):
+    """Send status messages to stderr, filtered by the --quiet/--verbose flags."""
+    if not log.handlers:
+        handler = _StderrHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.propagate = False
+    
+    if quiet:
+        log.setLevel(logging.ERROR)
+    elif verbose:
+        log.setLevel(logging.DEBUG)
+    else:
+        log.setLevel(logging.INFO)
+
+
+def _load_praw():
+    """Import PRAW and its HTTP stack on first use.
+    
+    These imports dominate startup time, so they are kept out of module import
+    to keep ``--help``, argument errors and daemon-forwarded commands fast.
+    """
+    global praw, requests, HTTPAdapter, Retry
+    global Submission, Comment, RedditAPIException, ClientException, TooManyRequests
+    
+    import praw
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from praw.models import Submission, Comment
+    from praw.exceptions import RedditAPIException, ClientException
+    from prawcore.exceptions import TooManyRequests
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Check whether Reddit rejected the session itself (401, e.g. InvalidToken).
+    
+    A 403 only means this one resource is off limits (a private or banned
+    subreddit, say), so it is not treated as an auth failure.
+    """
+    return getattr(getattr(error, 'response', None), 'status_code', None) == 401
+
+
+def _safe(default, action: str):
+    """Log and swallow errors from an ``_impl`` method, returning ``default``.
+    
+    Rate-limit and 401 errors are re-raised so ``_execute_with_retry`` can
+    still wait and retry on them, or drop cached objects on an auth failure.
+    ``action`` is kept on the wrapper so that log line can name it too.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except (RedditAPIException, TooManyRequests):
+                raise
+            except Exception as e:
+                if _is_auth_error(e):
+                    raise
+                log.error(f"❌ Error {action}: {e}")
+                return copy.copy(default)
+        wrapper.action = action
+        return wrapper
+    return decorator
+
+
+def _bounded_put(cache: Dict, key, value, maxsize: int):
+    """Store a value in a dict used as a cache, evicting the oldest when full."""
+    cache.pop(key, None)
+    if len(cache) >= maxsize:
+        # Dicts keep insertion order, so the first key is the oldest
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def _prefetch(listing, limit: Optional[int]):
+    """Iterate a PRAW listing while a background thread fetches ahead.
+    
+    Listings are fetched one page at a time as they are consumed. For listings
+    spanning several pages, a producer thread keeps pulling items so the next
+    page is requested while the current one is processed. Errors raised by
+    the listing are re-raised in the consuming thread.
+    """
+    if limit is not None and limit <= LISTING_PAGE_SIZE:
+        yield from listing
+        return
+    
+    items = queue.Queue(maxsize=LISTING_PAGE_SIZE)
+    done = object()
+    stop = threading.Event()
+    
+    def put(value) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in listing:
+                if not put(item):
+                    return
+            put(done)
+        except Exception as e:
+            put(e)
+    
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+class RateLimitGovernor:
+    """Pace requests using the rate-limit headers Reddit sends back.
+    
+    Reddit reports how many requests are left in the current window and when
+    it resets. Once fewer than ``threshold`` remain, calls are spread evenly
+    over the rest of the window instead of running into 429 responses.
+    """
+    
+    def __init__(self, threshold: int = PACING_THRESHOLD):
+        self.threshold = threshold
+        self.remaining = None
+        self.reset_at = None
+        self.last_request = None
+        self._lock = threading.Lock()
+    
+    def observe(self, response, *args, **kwargs):
+        """Update the window from a response (a requests response hook)."""
+        headers = response.headers
+        now = time.monotonic()
+        with self._lock:
+            self.last_request = now
+            try:
+                self.remaining = float(headers['x-ratelimit-remaining'])
+                self.reset_at = now + float(headers['x-ratelimit-reset'])
+            except (KeyError, TypeError, ValueError):
+                pass
+            if response.status_code == 429:
+                try:
+                    self.reset_at = now + float(headers['retry-after'])
+                except (KeyError, TypeError, ValueError):
+                    pass
+                self.remaining = 0
+    
+    def delay(self) -> float:
+        """Seconds to wait before the next request to stay inside the window."""
+        with self._lock:
+            if self.remaining is None or self.reset_at is None or self.remaining >= self.threshold:
+                return 0.0
+            now = time.monotonic()
+            window_left = max(0.0, self.reset_at - now)
+            if self.remaining < 1:
+                return window_left
+            spacing = window_left / self.remaining
+            return max(0.0, self.last_request + spacing - now)
+    
+    def concurrency(self, wanted: int) -> int:
+        """How many requests may run at once without outpacing the window.
+        
+        Paced calls are spaced from the last request, so parallel workers would
+        all see the same delay and fire together. Once pacing starts, run them
+        one at a time.
+        """
+        with self._lock:
+            if self.remaining is None or self.remaining >= self.threshold:
+                return wanted
+            return 1
 
-import praw
-from praw.models import Submission, Comment
-from praw.exceptions import RedditAPIException, ClientException
+
+class _DiskCache:
+    """Response cache stored in SQLite so results outlive a single CLI run.
+    
+    Values are the plain row dicts and lists the fetchers return, stored as
+    JSON. The cache is best effort: if the file cannot be opened or read,
+    lookups miss and writes are dropped. Entries are kept per ``scope`` (the
+    authenticated account), since what Reddit returns depends on who asks.
+    """
+    
+    def __init__(self, path: str = CACHE_FILE, scope: str = None):
+        self.path = path
+        self.scope = scope
+        self._db = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+        
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            # WAL lets concurrent runs (and batch threads) read while one writes
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires REAL NOT NULL, value BLOB NOT NULL)"
+            )
+            self._db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+            self._db.commit()
+        return self._db
+    
+    def _row_key(self, key: Tuple) -> str:
+        return repr((CACHE_VERSION, self.scope, key))
+    
+    def get(self, key: Tuple):
+        """Return ``(expires, value)`` for a live entry, or None."""
+        import sqlite3
+        
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT expires, value FROM responses WHERE key = ? AND expires > ?",
+                    (self._row_key(key), time.time())
+                ).fetchone()
+            return (row[0], _loads_json(row[1])) if row else None
+        except (sqlite3.Error, OSError, ValueError) as e:
+            log.debug(f"Response cache unavailable: {e}")
+            return None
+    
+    def put(self, key: Tuple, expires: float, value):
+        import sqlite3
+        
+        try:
+            with self._lock:
+                db = self._connect()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, expires, value) VALUES (?, ?, ?)",
+                    (self._row_key(key), expires, _dumps_json(value))
+                )
+                db.commit()
+        except (sqlite3.Error, OSError, TypeError) as e:
+            log.debug(f"Response cache unavailable: {e}")
 
 
 class RedditCLI:
-    def __init__(self, config_file: str = "reddit_config.json"):
+    def __init__(self, config_file: str = "reddit_config.json", use_cache: bool = True,
+                 cache_ttl: float = RESPONSE_CACHE_TTL, fast: bool = False):
         """Initialize the Reddit CLI with configuration."""
         self.config_file = config_file
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self.fast = fast
         self.reddit = None
+        self.username = None
+        self._me_cache = None
+        self._me_fresh = False
+        self._subreddit_cache = {}
+        self._redditor_cache = {}
+        self._submission_cache = {}
+        self._response_cache = {}
+        self._disk_cache = _DiskCache()
+        self._retry_stats = collections.Counter()
+        self.retry_delay = self._load_retry_delay()
+        self._shutdown = threading.Event()
+        self.governor = RateLimitGovernor()
         self.load_config()
     
     def load_config(self):
         """Load Reddit API configuration from file."""
         if not os.path.exists(self.config_file):
             self.create_config_template()
-            print(f"Configuration template created at {self.config_file}")
-            print("Please fill in your Reddit API credentials and run again.")
+            log.info(f"Configuration template created at {self.config_file}")
+            log.info("Please fill in your Reddit API credentials and run again.")
             sys.exit(1)
         
+        _load_praw()
+        
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config = _loads_json(f.read())
+            
+            self.username = config['username']
+            self._disk_cache.scope = self.username.lower()
             
             self.reddit = praw.Reddit(
                 client_id=config['client_id'],
                 client_secret=config['client_secret'],
                 user_agent=config.get('user_agent', 'RedditCLI/1.0'),
                 username=config['username'],
-                password=config['password']
+                password=config['password'],
+                requestor_kwargs={'session': self._create_http_session()}
             )
             
-            # Add initial delay to avoid rate limiting
-            print("⏳ Waiting 10 seconds to avoid rate limiting...")
-            time.sleep(10)
-            
             # Test the connection with rate limiting
             self._test_connection_with_retry()
             
         except Exception as e:
-            print(f"Error loading configuration: {e}")
+            log.error(f"Error loading configuration: {e}")
             sys.exit(1)
     
+    def _me(self):
+        """Return the authenticated user, fetching it from Reddit only once."""
+        if self._me_cache is None:
+            self._me_cache = self.reddit.user.me()
+            self._me_fresh = True
+        return self._me_cache
+    
+    def _is_own(self, author) -> bool:
+        """Check whether an author is the configured user, without any API call."""
+        return author is not None and str(author).lower() == self.username.lower()
+    
+    def _sub(self, subreddit_name: str):
+        """Return a memoized Subreddit object for the given name."""
+        key = subreddit_name.lower()
+        if key not in self._subreddit_cache:
+            self._subreddit_cache[key] = self.reddit.subreddit(subreddit_name)
+        return self._subreddit_cache[key]
+    
+    def _redditor(self, username: str):
+        """Return a memoized Redditor object for the given name.
+        
+        The logged-in user is fetched at startup, so in that same command the
+        object is reused instead of fetching the same profile again. Later
+        commands in a daemon or REPL session read a fresh profile.
+        """
+        key = username.lower()
+        if self.username and key == self.username.lower() and self._me_fresh:
+            return self._me()
+        if key not in self._redditor_cache:
+            self._redditor_cache[key] = self.reddit.redditor(username)
+        return self._redditor_cache[key]
+    
+    def _submission(self, post_url: str):
+        """Return a Submission for the given URL, reusing it for a short while.
+        
+        Looking up the same post again (in a REPL or daemon session, or with
+        repeated URLs) then reuses the already fetched title, author and
+        comments instead of asking Reddit again. The object is built from the
+        ID alone and only fetched when an attribute like ``.title`` is read,
+        so votes and saves, which need just the ID, cost no extra request.
+        """
+        key = self._parse_submission_id(post_url)
+        now = time.monotonic()
+        entry = self._submission_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        submission = self.reddit.submission(id=key)
+        _bounded_put(self._submission_cache, key, (now + SUBMISSION_CACHE_TTL, submission),
+                     SUBMISSION_CACHE_SIZE)
+        return submission
+    
+    def _clear_lookup_cache(self, include_me: bool = True):
+        """Forget memoized Reddit objects so they are fetched fresh next time.
+        
+        Submissions expire on their own, so they are only dropped together
+        with the authenticated user.
+        """
+        self._me_fresh = False
+        if include_me:
+            self._me_cache = None
+            self._submission_cache.clear()
+        self._subreddit_cache.clear()
+        self._redditor_cache.clear()
+    
+    @staticmethod
+    def _parse_submission_id(post_url: str) -> str:
+        """Extract the post ID from a post permalink or short link."""
+        match = SUBMISSION_ID_PATTERN.search(post_url)
+        if match:
+            return match.group(1)
+        return Submission.id_from_url(post_url)
+    
+    @staticmethod
+    def _parse_comment_id(comment_url: str) -> str:
+        """Extract the comment ID from a comment permalink.
+        
+        Handles trailing slashes and query strings such as ``?context=3``.
+        """
+        match = COMMENT_ID_PATTERN.search(comment_url)
+        if match:
+            return match.group(1)
+        return comment_url.split('?')[0].rstrip('/').split('/')[-1]
+    
+    @staticmethod
+    def _truncate(text: str, length: int = 200) -> str:
+        """Shorten text to ``length`` characters, marking the cut with '...'."""
+        return text if len(text) <= length else text[:length] + "..."
+    
+    @staticmethod
+    def _listing_attr(item, attribute: str, default=None):
+        """Read an attribute that came with a listing without triggering a lazy fetch.
+        
+        PRAW fetches the full object when a missing attribute is accessed, which
+        turns a single listing request into one extra request per item.
+        """
+        return vars(item).get(attribute, default)
+    
+    @classmethod
+    def _author_name(cls, item) -> str:
+        """Name of an item's author from listing data, or '[deleted]'.
+        
+        Some inbox items (e.g. messages from a subreddit) come without an
+        author, so reading ``item.author`` directly would fetch the item.
+        """
+        author = cls._listing_attr(item, 'author')
+        return str(author) if author else '[deleted]'
+    
+    def _cached(self, key: Tuple, fetch, ttl: Optional[float] = None):
+        """Return a copy of a recently fetched result, calling ``fetch`` on a miss.
+        
+        Results are kept in memory and in the on-disk cache, so repeated CLI
+        runs within ``ttl`` seconds (``cache_ttl`` by default) skip the request.
+        Empty results are not cached so failures are retried next time.
+        """
+        if not self.use_cache:
+            return fetch()
+        
+        now = time.time()
+        entry = self._response_cache.get(key)
+        if not entry or entry[0] <= now:
+            entry = self._disk_cache.get(key)
+            if entry:
+                self._remember(key, entry)
+        if entry and entry[0] > now:
+            return copy.copy(entry[1])
+        
+        value = fetch()
+        if value:
+            entry = (now + (self.cache_ttl if ttl is None else ttl), value)
+            self._remember(key, entry)
+            self._disk_cache.put(key, *entry)
+        
+        return copy.copy(value)
+    
+    def _remember(self, key: Tuple, entry: Tuple):
+        """Store a cache entry in memory, evicting the oldest when full."""
+        _bounded_put(self._response_cache, key, entry, RESPONSE_CACHE_SIZE)
+    
+    def _create_http_session(self) -> requests.Session:
+        """Create a keep-alive HTTP session with a pooled, retrying adapter."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                # 429s go to _execute_with_retry, which caps and can interrupt the wait
+                status_forcelist=[500, 502, 503, 504],
+                respect_retry_after_header=False,
+                raise_on_status=False  # Let PRAW turn the final response into its own exception
+            )
+        )
+        session.mount('https://', adapter)
+        session.hooks['response'].append(self.governor.observe)
+        return session
+    
     def _test_connection_with_retry(self, max_retries=3, delay=5):
         """Test Reddit connection with retry logic and rate limiting."""
         for attempt in range(max_retries):
             try:
                 # Test the connection
-                user = self.reddit.user.me()
-                print(f"✅ Connected to Reddit as: {user}")
+                user = self._me()
+                log.info(f"✅ Connected to Reddit as: {user}")
                 return True
                 
             except RedditAPIException as e:
                 if "RATE_LIMIT" in str(e) or "429" in str(e):
-                    print(f"⏳ Rate limited. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
+                    log.warning(f"⏳ Rate limited. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
                     if attempt < max_retries - 1:
-                        time.sleep(delay)
+                        self._sleep(delay)
                         delay *= 2  # Exponential backoff
                         continue
                     else:
-                        print("❌ Rate limit exceeded. Please wait before trying again.")
+                        log.error("❌ Rate limit exceeded. Please wait before trying again.")
                         sys.exit(1)
                 else:
-                    print(f"❌ Reddit API error: {e}")
+                    log.error(f"❌ Reddit API error: {e}")
                     sys.exit(1)
                     
             except ClientException as e:
                 if "401" in str(e) or "unauthorized" in str(e).lower():
-                    print(f"❌ Authentication failed: {e}")
-                    print("💡 Please check your credentials in reddit_config.json")
+                    log.error(f"❌ Authentication failed: {e}")
+                    log.error("💡 Please check your credentials in reddit_config.json")
                     sys.exit(1)
                 else:
-                    print(f"❌ Client error: {e}")
+                    log.error(f"❌ Client error: {e}")
                     sys.exit(1)
                     
             except Exception as e:
-                print(f"❌ Unexpected error: {e}")
+                log.error(f"❌ Unexpected error: {e}")
                 if attempt < max_retries - 1:
-                    print(f"⏳ Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    log.warning(f"⏳ Retrying in {delay} seconds...")
+                    self._sleep(delay)
                     delay *= 2
                 else:
                     sys.exit(1)
         
         return False
     
-    def _execute_with_retry(self, func, *args, max_retries=3, delay=5, **kwargs):
-        """Execute a function with retry logic and rate limiting."""
+    def _execute_with_retry(self, func, *args, max_retries=3, delay=None, max_wait=60, **kwargs):
+        """Execute a function with retry logic and rate limiting.
+        
+        Rate-limit waits follow what Reddit asks for. If that is longer than
+        ``max_wait`` seconds, RateLimitExceeded is raised instead of sleeping.
+        The default initial delay is tuned from earlier runs.
+        """
+        if delay is None:
+            delay = self.retry_delay
+        
         for attempt in range(max_retries):
             try:
+                self._respect_rate_limit()
                 return func(*args, **kwargs)
                 
-            except RedditAPIException as e:
-                if "RATE_LIMIT" in str(e) or "429" in str(e):
-                    print(f"⏳ Rate limited. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
-                    if attempt < max_retries - 1:
-                        time.sleep(delay)
-                        delay *= 2  # Exponential backoff
-                        continue
-                    else:
-                        print("❌ Rate limit exceeded. Please wait before trying again.")
+            except (RedditAPIException, TooManyRequests) as e:
+                # Without a wait time in the error, use the window reset the
+                # governor saw in the headers before falling back to backoff
+                fallback = self.governor.delay() or self._backoff(delay)
+                wait = self._rate_limit_wait(e, fallback=fallback)
+                if wait is None:
+                    log.error(f"❌ Reddit API error: {e}")
+                    return None
+                if isinstance(e, TooManyRequests):
+                    wait += random.uniform(0, 1)  # Keep parallel batch calls from retrying together
+                
+                if wait > max_wait:
+                    raise RateLimitExceeded(wait)
+                
+                if attempt < max_retries - 1:
+                    log.debug(f"⏳ Rate limited. Waiting {wait:.0f} seconds before retry {attempt + 1}/{max_retries}...")
+                    self._record_retry(wait, rate_limited=True)
+                    if not self._sleep(wait):
                         return None
+                    delay *= 2  # Exponential backoff when Reddit gives no wait time
+                    continue
                 else:
-                    print(f"❌ Reddit API error: {e}")
+                    log.error("❌ Rate limit exceeded. Please wait before trying again.")
                     return None
                     
             except ClientException as e:
                 if "401" in str(e) or "unauthorized" in str(e).lower():
-                    print(f"❌ Authentication failed: {e}")
+                    log.error(f"❌ Authentication failed: {e}")
+                    self._clear_lookup_cache()
                     return None
                 else:
-                    print(f"❌ Client error: {e}")
+                    log.error(f"❌ Client error: {e}")
                     return None
                     
             except Exception as e:
-                print(f"❌ Error: {e}")
+                if _is_auth_error(e):
+                    # Cached objects may belong to a session Reddit no longer accepts
+                    action = getattr(func, 'action', None)
+                    log.error(f"❌ Error {action}: {e}" if action else f"❌ Authentication failed: {e}")
+                    self._clear_lookup_cache()
+                    return None
                 if attempt < max_retries - 1:
-                    print(f"⏳ Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    backoff = self._backoff(delay)
+                    log.debug(f"⏳ Error: {e}. Retrying in {backoff:.1f} seconds...")
+                    self._record_retry(backoff)
+                    if not self._sleep(backoff):
+                        return None
                     delay *= 2
                 else:
+                    log.error(f"❌ Error: {e}")
                     return None
         
         return None
     
+    def _record_retry(self, backoff: float, rate_limited: bool = False):
+        """Count a retry and the time spent backing off before it."""
+        self._retry_stats['total_retries'] += 1
+        self._retry_stats['backoff_seconds'] += backoff
+        if rate_limited:
+            self._retry_stats['rate_limited'] += 1
+            self._retry_stats['rate_limit_seconds'] += backoff
+    
+    def _load_retry_delay(self) -> float:
+        """Read the tuned initial retry delay saved by earlier runs."""
+        try:
+            with open(STATE_FILE, 'r') as f:
+                delay = float(json.load(f)['retry_delay'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return DEFAULT_RETRY_DELAY
+        return min(max(delay, MIN_RETRY_DELAY), MAX_RETRY_DELAY)
+    
+    def finish_retry_stats(self):
+        """Log a one-line retry summary and tune the initial delay for next time.
+        
+        The saved delay moves a fraction of the way toward the average
+        rate-limit wait seen in this run, so it settles on what Reddit
+        typically asks for.
+        """
+        stats = self._retry_stats
+        self._retry_stats = collections.Counter()
+        if not stats['total_retries']:
+            return
+        
+        avg_backoff = stats['backoff_seconds'] / stats['total_retries']
+        log.info(f"🔁 total_retries={stats['total_retries']} rate_limited={stats['rate_limited']} "
+                 f"avg_backoff={avg_backoff:.1f}s")
+        
+        if not stats['rate_limited']:
+            return
+        
+        avg_rate_limit_wait = stats['rate_limit_seconds'] / stats['rate_limited']
+        tuned = self.retry_delay + RETRY_DELAY_LEARNING_RATE * (avg_rate_limit_wait - self.retry_delay)
+        self.retry_delay = min(max(tuned, MIN_RETRY_DELAY), MAX_RETRY_DELAY)
+        try:
+            with open(STATE_FILE, 'w') as f:
+                json.dump({'retry_delay': self.retry_delay}, f)
+        except OSError as e:
+            log.debug(f"Could not save retry state: {e}")
+    
+    @staticmethod
+    def _rate_limit_wait(error: Exception, fallback: float) -> Optional[float]:
+        """Work out how long Reddit wants us to wait after a rate-limit error.
+        
+        Returns None if the error is not a rate limit, or ``fallback`` when
+        Reddit did not say how long to wait.
+        """
+        if isinstance(error, TooManyRequests):
+            headers = error.response.headers
+            for header in ('retry-after', 'x-ratelimit-reset'):
+                try:
+                    return float(headers[header])
+                except (KeyError, TypeError, ValueError):
+                    continue
+            return fallback
+        
+        for item in error.items:
+            if item.error_type == "RATELIMIT":
+                match = RATELIMIT_WAIT_PATTERN.search(item.message or "")
+                if not match:
+                    return fallback
+                amount, unit = int(match.group(1)), match.group(2).lower()
+                if unit.startswith("minute"):
+                    return amount * 60.0
+                if unit.startswith("millisecond"):
+                    return amount / 1000.0
+                return float(amount)
+        
+        return None
+    
+    @staticmethod
+    def _backoff(delay: float) -> float:
+        """Jitter a backoff delay so parallel callers don't retry in lockstep."""
+        return min(delay * (1 + random.random() * 0.5), MAX_BACKOFF)
+    
+    def _sleep(self, seconds: float) -> bool:
+        """Wait without blocking shutdown.
+        
+        Returns False if the wait was cut short because the CLI is stopping,
+        so callers can give up instead of retrying.
+        """
+        return not self._shutdown.wait(seconds)
+    
+    def _respect_rate_limit(self):
+        """Wait as long as the governor says before making the next request."""
+        wait = self.governor.delay()
+        if wait > 0:
+            remaining = int(self.governor.remaining)
+            log.debug(f"⏳ {remaining} requests left in this window. Waiting {wait:.1f} seconds...")
+            self._sleep(wait)
+    
     def create_config_template(self):
         """Create a configuration template file."""
         template = {
@@ -153,38 +771,84 @@ class RedditCLI:
     def post_to_subreddit(self, subreddit_name: str, title: str, 
                          content: str = None, url: str = None, 
                          flair_id: str = None) -> Optional[Submission]:
-        """Post to a subreddit with rate limiting."""
+        """Post to a subreddit with rate limiting (link post if a URL is given)."""
+        if url:
+            return self.post_link(subreddit_name, title, url, flair_id)
+        return self.post_text(subreddit_name, title, content, flair_id)
+    
+    def post_link(self, subreddit_name: str, title: str, url: str,
+                  flair_id: str = None) -> Optional[Submission]:
+        """Submit a link post with rate limiting."""
+        return self._execute_with_retry(
+            self._post_link_impl,
+            subreddit_name, title, url, flair_id
+        )
+    
+    def post_text(self, subreddit_name: str, title: str, content: str = None,
+                  flair_id: str = None) -> Optional[Submission]:
+        """Submit a text post with rate limiting."""
         return self._execute_with_retry(
-            self._post_to_subreddit_impl,
-            subreddit_name, title, content, url, flair_id
+            self._post_text_impl,
+            subreddit_name, title, content, flair_id
         )
     
-    def _post_to_subreddit_impl(self, subreddit_name: str, title: str, 
-                               content: str = None, url: str = None, 
-                               flair_id: str = None) -> Optional[Submission]:
-        """Internal implementation of posting to subreddit."""
-        subreddit = self.reddit.subreddit(subreddit_name)
+    def _post_link_impl(self, subreddit_name: str, title: str, url: str,
+                        flair_id: str = None) -> Optional[Submission]:
+        """Internal implementation of submitting a link post."""
+        submission = self._sub(subreddit_name).submit(
+            title=title,
+            url=url,
+            flair_id=flair_id
+        )
+        self._log_new_post(subreddit_name, title, submission)
+        return submission
+    
+    def _post_text_impl(self, subreddit_name: str, title: str, content: str = None,
+                        flair_id: str = None) -> Optional[Submission]:
+        """Internal implementation of submitting a text post."""
+        submission = self._sub(subreddit_name).submit(
+            title=title,
+            selftext=content or "",
+            flair_id=flair_id
+        )
+        self._log_new_post(subreddit_name, title, submission)
+        return submission
+    
+    def _log_new_post(self, subreddit_name: str, title: str, submission: Submission):
+        """Report a successful submission."""
+        log.info(f"✅ Successfully posted to r/{subreddit_name}")
+        log.info(f"📝 Title: {title}")
+        log.info(f"🔗 URL: {REDDIT_URL}{submission.permalink}")
+    
+    def batch(self, calls: List[Tuple[str, tuple, dict]], max_workers: int = 4) -> List:
+        """Run independent CLI methods concurrently.
         
-        if url:
-            # Link post
-            submission = subreddit.submit(
-                title=title,
-                url=url,
-                flair_id=flair_id
-            )
-        else:
-            # Text post
-            submission = subreddit.submit(
-                title=title,
-                selftext=content or "",
-                flair_id=flair_id
-            )
+        Each call is a ``(method_name, args, kwargs)`` tuple. Results are
+        returned in the same order as the calls. The pool is kept small to
+        stay within Reddit's per-second request cap, and drops to a single
+        worker once few requests are left in the rate-limit window.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
         
-        print(f"✅ Successfully posted to r/{subreddit_name}")
-        print(f"📝 Title: {title}")
-        print(f"🔗 URL: https://reddit.com{submission.permalink}")
+        results = [None] * len(calls)
+        max_workers = self.governor.concurrency(max_workers)
         
-        return submission
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(getattr(self, name), *call_args, **call_kwargs): index
+                for index, (name, call_args, call_kwargs) in enumerate(calls)
+            }
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            except KeyboardInterrupt:
+                # Wake any worker sleeping through a rate limit so we exit promptly
+                self._shutdown.set()
+                for future in futures:
+                    future.cancel()
+                raise
+        
+        return results
     
     def get_subreddit_flairs(self, subreddit_name: str) -> List[Dict]:
         """Get available flairs for a subreddit with rate limiting."""
@@ -195,7 +859,7 @@ class RedditCLI:
     
     def _get_subreddit_flairs_impl(self, subreddit_name: str) -> List[Dict]:
         """Internal implementation of getting subreddit flairs."""
-        subreddit = self.reddit.subreddit(subreddit_name)
+        subreddit = self._sub(subreddit_name)
         flairs = []
         
         for flair in subreddit.flair.link_templates:
@@ -207,39 +871,48 @@ class RedditCLI:
         
         return flairs
     
-    def _add_delay(self, seconds=2):
-        """Add a delay to prevent rate limiting."""
-        print(f"⏳ Waiting {seconds} seconds to avoid rate limiting...")
-        time.sleep(seconds)
-    
     def get_post_responses(self, submission: Submission, limit: int = 10) -> List[Dict]:
         """Get responses (comments) for a post."""
-        try:
-            responses = []
-            submission.comments.replace_more(limit=0)
-            
-            for comment in submission.comments[:limit]:
-                responses.append({
-                    'author': str(comment.author) if comment.author else '[deleted]',
-                    'body': comment.body,
-                    'score': comment.score,
-                    'created_utc': datetime.fromtimestamp(comment.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                    'permalink': f"https://reddit.com{comment.permalink}"
-                })
-            
-            return responses
-            
-        except Exception as e:
-            print(f"❌ Error getting responses: {e}")
-            return []
+        return self._cached(
+            ('post_responses', submission.id, submission.comment_sort, limit),
+            lambda: self._execute_with_retry(self._get_post_responses_impl, submission, limit)
+        ) or []
+    
+    @_safe([], "getting responses")
+    def _get_post_responses_impl(self, submission: Submission, limit: int = 10) -> List[Dict]:
+        """Internal implementation of getting post responses.
+        
+        Only the first ``limit`` top-level comments are requested, as plain
+        JSON, instead of loading the post's whole comment forest.
+        """
+        responses = []
+        # depth=1 leaves out replies, so Reddit's limit counts top-level comments
+        listing = self.reddit.request(
+            method="GET",
+            path=f"comments/{submission.id}",
+            params={'limit': limit, 'depth': 1, 'sort': submission.comment_sort, 'raw_json': 1}
+        )[1]['data']
+        # Skip "load more" placeholders
+        top_level = (child['data'] for child in listing['children'] if child['kind'] == 't1')
+        
+        for comment in itertools.islice(top_level, limit):
+            responses.append({
+                'author': comment.get('author') or '[deleted]',
+                'body': comment['body'],
+                'score': comment['score'],
+                'created_utc': int(comment['created_utc']),
+                'permalink': REDDIT_URL + comment['permalink']
+            })
+        
+        return responses
     
     def get_post_by_url(self, post_url: str) -> Optional[Submission]:
         """Get a Reddit post by its URL."""
         try:
-            submission = self.reddit.submission(url=post_url)
+            submission = self._submission(post_url)
             return submission
         except Exception as e:
-            print(f"❌ Error getting post from URL: {e}")
+            log.error(f"❌ Error getting post from URL: {e}")
             return None
     
     def delete_post(self, post_url: str) -> bool:
@@ -249,25 +922,21 @@ class RedditCLI:
             post_url
         ) or False
     
+    @_safe(False, "deleting post")
     def _delete_post_impl(self, post_url: str) -> bool:
         """Internal implementation of deleting a post."""
-        try:
-            submission = self.reddit.submission(url=post_url)
-            
-            # Check if the post belongs to the current user
-            if submission.author != self.reddit.user.me():
-                print(f"❌ You can only delete your own posts")
-                return False
-            
-            # Delete the post
-            submission.delete()
-            print(f"✅ Successfully deleted post: {submission.title}")
-            print(f"🔗 URL: {post_url}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error deleting post: {e}")
+        submission = self._submission(post_url)
+        
+        # Check if the post belongs to the current user
+        if not self._is_own(submission.author):
+            log.error(f"❌ You can only delete your own posts")
             return False
+        
+        # Delete the post
+        submission.delete()
+        log.info(f"✅ Successfully deleted post: {submission.title}")
+        log.info(f"🔗 URL: {post_url}")
+        return True
     
     def comment_on_post(self, post_url: str, comment_text: str) -> Optional[Comment]:
         """Comment on a Reddit post with rate limiting."""
@@ -276,21 +945,17 @@ class RedditCLI:
             post_url, comment_text
         )
     
+    @_safe(None, "commenting on post")
     def _comment_on_post_impl(self, post_url: str, comment_text: str) -> Optional[Comment]:
         """Internal implementation of commenting on a post."""
-        try:
-            submission = self.reddit.submission(url=post_url)
-            comment = submission.reply(comment_text)
-            
-            print(f"✅ Successfully commented on post: {submission.title}")
-            print(f"💭 Comment: {comment_text[:100]}...")
-            print(f"🔗 Comment URL: https://reddit.com{comment.permalink}")
-            
-            return comment
-            
-        except Exception as e:
-            print(f"❌ Error commenting on post: {e}")
-            return None
+        submission = self._submission(post_url)
+        comment = submission.reply(comment_text)
+        
+        log.info(f"✅ Successfully commented on post: {submission.title}")
+        log.info(f"💭 Comment: {self._truncate(comment_text, 100)}")
+        log.info(f"🔗 Comment URL: {REDDIT_URL}{comment.permalink}")
+        
+        return comment
     
     def reply_to_comment(self, comment_url: str, reply_text: str) -> Optional[Comment]:
         """Reply to a Reddit comment with rate limiting."""
@@ -299,115 +964,115 @@ class RedditCLI:
             comment_url, reply_text
         )
     
+    @_safe(None, "replying to comment")
     def _reply_to_comment_impl(self, comment_url: str, reply_text: str) -> Optional[Comment]:
         """Internal implementation of replying to a comment."""
-        try:
-            # Extract comment ID from URL
-            comment_id = comment_url.split('/')[-1]
-            comment = self.reddit.comment(id=comment_id)
-            reply = comment.reply(reply_text)
-            
-            print(f"✅ Successfully replied to comment")
-            print(f"💭 Reply: {reply_text[:100]}...")
-            print(f"🔗 Reply URL: https://reddit.com{reply.permalink}")
-            
-            return reply
-            
-        except Exception as e:
-            print(f"❌ Error replying to comment: {e}")
-            return None
+        comment = self.reddit.comment(id=self._parse_comment_id(comment_url))
+        reply = comment.reply(reply_text)
+        
+        log.info(f"✅ Successfully replied to comment")
+        log.info(f"💭 Reply: {self._truncate(reply_text, 100)}")
+        log.info(f"🔗 Reply URL: {REDDIT_URL}{reply.permalink}")
+        
+        return reply
     
     def get_hot_posts(self, subreddit_name: str, limit: int = 10) -> List[Dict]:
         """Get hot posts from a subreddit for commenting opportunities."""
-        return self._execute_with_retry(
-            self._get_hot_posts_impl,
-            subreddit_name, limit
+        return self._cached(
+            ('hot_posts', subreddit_name.lower(), limit, self.fast),
+            lambda: self._execute_with_retry(self._get_hot_posts_impl, subreddit_name, limit)
         ) or []
     
+    @_safe([], "getting hot posts")
     def _get_hot_posts_impl(self, subreddit_name: str, limit: int = 10) -> List[Dict]:
         """Internal implementation of getting hot posts."""
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            posts = []
-            
-            for submission in subreddit.hot(limit=limit):
-                posts.append({
-                    'id': submission.id,
-                    'title': submission.title,
-                    'score': submission.score,
-                    'num_comments': submission.num_comments,
-                    'url': f"https://reddit.com{submission.permalink}",
-                    'created_utc': datetime.fromtimestamp(submission.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                    'author': str(submission.author) if submission.author else '[deleted]'
-                })
-            
-            return posts
-            
-        except Exception as e:
-            print(f"❌ Error getting hot posts: {e}")
-            return []
+        if self.fast:
+            return self._raw_submission_rows(f"r/{subreddit_name}/hot", limit)
+        
+        subreddit = self._sub(subreddit_name)
+        posts = []
+        
+        for submission in _prefetch(subreddit.hot(limit=limit), limit):
+            posts.append({
+                'id': submission.id,
+                'title': submission.title,
+                'subreddit': str(submission.subreddit),
+                'score': submission.score,
+                'num_comments': submission.num_comments,
+                'url': REDDIT_URL + submission.permalink,
+                'created_utc': int(submission.created_utc),
+                'author': self._author_name(submission)
+            })
+        
+        return posts
+    
+    def get_posts_from_subreddits(self, names: List[str], limit: int = 10) -> Dict[str, List[Dict]]:
+        """Get up to ``limit`` hot posts from each subreddit in one listing request.
+        
+        The subreddits are read together as r/one+two and the merged listing
+        is split back up by subreddit. A small subreddit next to a busy one
+        may get fewer than ``limit`` posts.
+        """
+        buckets = {name.lower(): [] for name in names}
+        for post in self.get_hot_posts("+".join(names), limit * len(names)):
+            bucket = buckets.get(post['subreddit'].lower())
+            if bucket is not None and len(bucket) < limit:
+                bucket.append(post)
+        return {name: buckets[name.lower()] for name in names}
     
     def search_subreddits(self, query: str, limit: int = 10) -> List[Dict]:
         """Search for subreddits by keywords."""
-        return self._execute_with_retry(
-            self._search_subreddits_impl,
-            query, limit
+        return self._cached(
+            ('search_subreddits', query, limit),
+            lambda: self._execute_with_retry(self._search_subreddits_impl, query, limit)
         ) or []
     
+    @_safe([], "searching subreddits")
     def _search_subreddits_impl(self, query: str, limit: int = 10) -> List[Dict]:
         """Internal implementation of searching subreddits."""
-        try:
-            subreddits = []
-            
-            for subreddit in self.reddit.subreddits.search(query, limit=limit):
-                subreddits.append({
-                    'name': subreddit.display_name,
-                    'title': subreddit.title,
-                    'description': subreddit.description[:200] + "..." if len(subreddit.description) > 200 else subreddit.description,
-                    'subscribers': subreddit.subscribers,
-                    'active_users': getattr(subreddit, 'active_user_count', 'N/A'),
-                    'url': f"https://reddit.com/r/{subreddit.display_name}",
-                    'nsfw': subreddit.over18
-                })
-            
-            return subreddits
-            
-        except Exception as e:
-            print(f"❌ Error searching subreddits: {e}")
-            return []
+        subreddits = []
+        
+        for subreddit in self.reddit.subreddits.search(query, limit=limit):
+            subreddits.append({
+                'name': subreddit.display_name,
+                'title': subreddit.title,
+                'description': self._truncate(subreddit.description),
+                'subscribers': subreddit.subscribers,
+                'active_users': self._listing_attr(subreddit, 'active_user_count', 'N/A'),
+                'url': f"{REDDIT_URL}/r/{subreddit.display_name}",
+                'nsfw': subreddit.over18
+            })
+        
+        return subreddits
     
     def get_subreddit_info(self, subreddit_name: str) -> Optional[Dict]:
         """Get detailed information about a subreddit."""
-        return self._execute_with_retry(
-            self._get_subreddit_info_impl,
-            subreddit_name
+        return self._cached(
+            ('subreddit_info', subreddit_name.lower()),
+            lambda: self._execute_with_retry(self._get_subreddit_info_impl, subreddit_name)
         )
     
+    @_safe(None, "getting subreddit info")
     def _get_subreddit_info_impl(self, subreddit_name: str) -> Optional[Dict]:
         """Internal implementation of getting subreddit info."""
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            
-            info = {
-                'name': subreddit.display_name,
-                'title': subreddit.title,
-                'description': subreddit.description,
-                'public_description': subreddit.public_description,
-                'subscribers': subreddit.subscribers,
-                'active_users': getattr(subreddit, 'active_user_count', 'N/A'),
-                'created_utc': datetime.fromtimestamp(subreddit.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                'url': f"https://reddit.com/r/{subreddit.display_name}",
-                'nsfw': subreddit.over18,
-                'quarantine': subreddit.quarantine,
-                'submission_type': subreddit.submission_type,
-                'lang': subreddit.lang
-            }
-            
-            return info
-            
-        except Exception as e:
-            print(f"❌ Error getting subreddit info: {e}")
-            return None
+        subreddit = self._sub(subreddit_name)
+        
+        info = {
+            'name': subreddit.display_name,
+            'title': subreddit.title,
+            'description': subreddit.description,
+            'public_description': subreddit.public_description,
+            'subscribers': subreddit.subscribers,
+            'active_users': getattr(subreddit, 'active_user_count', 'N/A'),
+            'created_utc': int(subreddit.created_utc),
+            'url': f"{REDDIT_URL}/r/{subreddit.display_name}",
+            'nsfw': subreddit.over18,
+            'quarantine': subreddit.quarantine,
+            'submission_type': subreddit.submission_type,
+            'lang': subreddit.lang
+        }
+        
+        return info
     
     def subscribe_to_subreddit(self, subreddit_name: str) -> bool:
         """Subscribe to a subreddit."""
@@ -416,17 +1081,13 @@ class RedditCLI:
             subreddit_name
         ) or False
     
+    @_safe(False, "subscribing to subreddit")
     def _subscribe_to_subreddit_impl(self, subreddit_name: str) -> bool:
         """Internal implementation of subscribing to subreddit."""
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            subreddit.subscribe()
-            print(f"✅ Successfully subscribed to r/{subreddit_name}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error subscribing to subreddit: {e}")
-            return False
+        subreddit = self._sub(subreddit_name)
+        subreddit.subscribe()
+        log.info(f"✅ Successfully subscribed to r/{subreddit_name}")
+        return True
     
     def unsubscribe_from_subreddit(self, subreddit_name: str) -> bool:
         """Unsubscribe from a subreddit."""
@@ -435,72 +1096,60 @@ class RedditCLI:
             subreddit_name
         ) or False
     
+    @_safe(False, "unsubscribing from subreddit")
     def _unsubscribe_from_subreddit_impl(self, subreddit_name: str) -> bool:
         """Internal implementation of unsubscribing from subreddit."""
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            subreddit.unsubscribe()
-            print(f"✅ Successfully unsubscribed from r/{subreddit_name}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error unsubscribing from subreddit: {e}")
-            return False
+        subreddit = self._sub(subreddit_name)
+        subreddit.unsubscribe()
+        log.info(f"✅ Successfully unsubscribed from r/{subreddit_name}")
+        return True
     
     def get_trending_subreddits(self, limit: int = 10) -> List[Dict]:
         """Get trending subreddits."""
-        return self._execute_with_retry(
-            self._get_trending_subreddits_impl,
-            limit
+        return self._cached(
+            ('trending_subreddits', limit),
+            lambda: self._execute_with_retry(self._get_trending_subreddits_impl, limit)
         ) or []
     
+    @_safe([], "getting trending subreddits")
     def _get_trending_subreddits_impl(self, limit: int = 10) -> List[Dict]:
         """Internal implementation of getting trending subreddits."""
-        try:
-            subreddits = []
-            
-            # Get popular subreddits as a proxy for trending
-            for subreddit in self.reddit.subreddits.popular(limit=limit):
-                subreddits.append({
-                    'name': subreddit.display_name,
-                    'title': subreddit.title,
-                    'description': subreddit.description[:200] + "..." if len(subreddit.description) > 200 else subreddit.description,
-                    'subscribers': subreddit.subscribers,
-                    'active_users': getattr(subreddit, 'active_user_count', 'N/A'),
-                    'url': f"https://reddit.com/r/{subreddit.display_name}",
-                    'nsfw': subreddit.over18
-                })
-            
-            return subreddits
-            
-        except Exception as e:
-            print(f"❌ Error getting trending subreddits: {e}")
-            return []
+        subreddits = []
+        
+        # Get popular subreddits as a proxy for trending
+        for subreddit in self.reddit.subreddits.popular(limit=limit):
+            subreddits.append({
+                'name': subreddit.display_name,
+                'title': subreddit.title,
+                'description': self._truncate(subreddit.description),
+                'subscribers': subreddit.subscribers,
+                'active_users': self._listing_attr(subreddit, 'active_user_count', 'N/A'),
+                'url': f"{REDDIT_URL}/r/{subreddit.display_name}",
+                'nsfw': subreddit.over18
+            })
+        
+        return subreddits
     
     def get_subreddit_moderators(self, subreddit_name: str) -> List[Dict]:
         """Get moderators of a subreddit."""
-        return self._execute_with_retry(
-            self._get_subreddit_moderators_impl,
-            subreddit_name
+        return self._cached(
+            ('subreddit_moderators', subreddit_name.lower()),
+            lambda: self._execute_with_retry(self._get_subreddit_moderators_impl, subreddit_name)
         ) or []
     
+    @_safe([], "getting subreddit moderators")
     def _get_subreddit_moderators_impl(self, subreddit_name: str) -> List[Dict]:
         """Internal implementation of getting subreddit moderators."""
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            moderators = []
-            
-            for moderator in subreddit.moderator():
-                moderators.append({
-                    'name': str(moderator),
-                    'url': f"https://reddit.com/u/{moderator}"
-                })
-            
-            return moderators
-            
-        except Exception as e:
-            print(f"❌ Error getting subreddit moderators: {e}")
-            return []
+        subreddit = self._sub(subreddit_name)
+        moderators = []
+        
+        for moderator in subreddit.moderator():
+            moderators.append({
+                'name': str(moderator),
+                'url': f"{REDDIT_URL}/u/{moderator}"
+            })
+        
+        return moderators
     
     def upvote_post(self, post_url: str) -> bool:
         """Upvote a Reddit post."""
@@ -509,17 +1158,13 @@ class RedditCLI:
             post_url
         ) or False
     
+    @_safe(False, "upvoting post")
     def _upvote_post_impl(self, post_url: str) -> bool:
         """Internal implementation of upvoting a post."""
-        try:
-            submission = self.reddit.submission(url=post_url)
-            submission.upvote()
-            print(f"✅ Successfully upvoted post: {submission.title}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error upvoting post: {e}")
-            return False
+        submission = self._submission(post_url)
+        submission.upvote()
+        log.info(f"✅ Successfully upvoted post: {post_url}")
+        return True
     
     def downvote_post(self, post_url: str) -> bool:
         """Downvote a Reddit post."""
@@ -528,17 +1173,13 @@ class RedditCLI:
             post_url
         ) or False
     
+    @_safe(False, "downvoting post")
     def _downvote_post_impl(self, post_url: str) -> bool:
         """Internal implementation of downvoting a post."""
-        try:
-            submission = self.reddit.submission(url=post_url)
-            submission.downvote()
-            print(f"✅ Successfully downvoted post: {submission.title}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error downvoting post: {e}")
-            return False
+        submission = self._submission(post_url)
+        submission.downvote()
+        log.info(f"✅ Successfully downvoted post: {post_url}")
+        return True
     
     def upvote_comment(self, comment_url: str) -> bool:
         """Upvote a Reddit comment."""
@@ -547,18 +1188,13 @@ class RedditCLI:
             comment_url
         ) or False
     
+    @_safe(False, "upvoting comment")
     def _upvote_comment_impl(self, comment_url: str) -> bool:
         """Internal implementation of upvoting a comment."""
-        try:
-            comment_id = comment_url.split('/')[-1]
-            comment = self.reddit.comment(id=comment_id)
-            comment.upvote()
-            print(f"✅ Successfully upvoted comment")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error upvoting comment: {e}")
-            return False
+        comment = self.reddit.comment(id=self._parse_comment_id(comment_url))
+        comment.upvote()
+        log.info(f"✅ Successfully upvoted comment")
+        return True
     
     def downvote_comment(self, comment_url: str) -> bool:
         """Downvote a Reddit comment."""
@@ -567,107 +1203,94 @@ class RedditCLI:
             comment_url
         ) or False
     
+    @_safe(False, "downvoting comment")
     def _downvote_comment_impl(self, comment_url: str) -> bool:
         """Internal implementation of downvoting a comment."""
-        try:
-            comment_id = comment_url.split('/')[-1]
-            comment = self.reddit.comment(id=comment_id)
-            comment.downvote()
-            print(f"✅ Successfully downvoted comment")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error downvoting comment: {e}")
-            return False
+        comment = self.reddit.comment(id=self._parse_comment_id(comment_url))
+        comment.downvote()
+        log.info(f"✅ Successfully downvoted comment")
+        return True
     
     def get_user_profile(self, username: str) -> Optional[Dict]:
         """Get user profile information."""
-        return self._execute_with_retry(
-            self._get_user_profile_impl,
-            username
+        return self._cached(
+            ('user_profile', username.lower()),
+            lambda: self._execute_with_retry(self._get_user_profile_impl, username)
         )
     
+    @_safe(None, "getting user profile")
     def _get_user_profile_impl(self, username: str) -> Optional[Dict]:
         """Internal implementation of getting user profile."""
-        try:
-            user = self.reddit.redditor(username)
-            
-            profile = {
-                'name': str(user),
-                'created_utc': datetime.fromtimestamp(user.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                'comment_karma': user.comment_karma,
-                'link_karma': user.link_karma,
-                'is_employee': user.is_employee,
-                'is_mod': user.is_mod,
-                'is_gold': user.is_gold,
-                'url': f"https://reddit.com/u/{user}",
-                'has_verified_email': getattr(user, 'has_verified_email', False)
-            }
-            
-            return profile
-            
-        except Exception as e:
-            print(f"❌ Error getting user profile: {e}")
-            return None
+        user = self._redditor(username)
+        
+        profile = {
+            'name': str(user),
+            'created_utc': int(user.created_utc),
+            'comment_karma': user.comment_karma,
+            'link_karma': user.link_karma,
+            'is_employee': user.is_employee,
+            'is_mod': user.is_mod,
+            'is_gold': user.is_gold,
+            'url': f"{REDDIT_URL}/u/{user}",
+            'has_verified_email': getattr(user, 'has_verified_email', False)
+        }
+        
+        return profile
     
     def get_user_posts(self, username: str, limit: int = 10) -> List[Dict]:
         """Get posts by a user."""
-        return self._execute_with_retry(
-            self._get_user_posts_impl,
-            username, limit
+        return self._cached(
+            ('user_posts', username.lower(), limit, self.fast),
+            lambda: self._execute_with_retry(self._get_user_posts_impl, username, limit)
         ) or []
     
+    @_safe([], "getting user posts")
     def _get_user_posts_impl(self, username: str, limit: int = 10) -> List[Dict]:
         """Internal implementation of getting user posts."""
-        try:
-            user = self.reddit.redditor(username)
-            posts = []
-            
-            for submission in user.submissions.new(limit=limit):
-                posts.append({
-                    'id': submission.id,
-                    'title': submission.title,
-                    'subreddit': str(submission.subreddit),
-                    'score': submission.score,
-                    'num_comments': submission.num_comments,
-                    'url': f"https://reddit.com{submission.permalink}",
-                    'created_utc': datetime.fromtimestamp(submission.created_utc).strftime('%Y-%m-%d %H:%M:%S')
-                })
-            
-            return posts
-            
-        except Exception as e:
-            print(f"❌ Error getting user posts: {e}")
-            return []
+        if self.fast:
+            return self._raw_submission_rows(f"user/{username}/submitted", limit, {'sort': 'new'})
+        
+        user = self._redditor(username)
+        posts = []
+        
+        for submission in _prefetch(user.submissions.new(limit=limit), limit):
+            posts.append({
+                'id': submission.id,
+                'title': submission.title,
+                'subreddit': str(submission.subreddit),
+                'score': submission.score,
+                'num_comments': submission.num_comments,
+                'url': REDDIT_URL + submission.permalink,
+                'created_utc': int(submission.created_utc),
+                'author': self._author_name(submission)
+            })
+        
+        return posts
     
     def get_user_comments(self, username: str, limit: int = 10) -> List[Dict]:
         """Get comments by a user."""
-        return self._execute_with_retry(
-            self._get_user_comments_impl,
-            username, limit
+        return self._cached(
+            ('user_comments', username.lower(), limit),
+            lambda: self._execute_with_retry(self._get_user_comments_impl, username, limit)
         ) or []
     
+    @_safe([], "getting user comments")
     def _get_user_comments_impl(self, username: str, limit: int = 10) -> List[Dict]:
         """Internal implementation of getting user comments."""
-        try:
-            user = self.reddit.redditor(username)
-            comments = []
-            
-            for comment in user.comments.new(limit=limit):
-                comments.append({
-                    'id': comment.id,
-                    'body': comment.body[:200] + "..." if len(comment.body) > 200 else comment.body,
-                    'subreddit': str(comment.subreddit),
-                    'score': comment.score,
-                    'url': f"https://reddit.com{comment.permalink}",
-                    'created_utc': datetime.fromtimestamp(comment.created_utc).strftime('%Y-%m-%d %H:%M:%S')
-                })
-            
-            return comments
-            
-        except Exception as e:
-            print(f"❌ Error getting user comments: {e}")
-            return []
+        user = self._redditor(username)
+        comments = []
+        
+        for comment in _prefetch(user.comments.new(limit=limit), limit):
+            comments.append({
+                'id': comment.id,
+                'body': self._truncate(comment.body),
+                'subreddit': str(comment.subreddit),
+                'score': comment.score,
+                'url': REDDIT_URL + comment.permalink,
+                'created_utc': int(comment.created_utc)
+            })
+        
+        return comments
     
     def save_post(self, post_url: str) -> bool:
         """Save a Reddit post."""
@@ -676,17 +1299,13 @@ class RedditCLI:
             post_url
         ) or False
     
+    @_safe(False, "saving post")
     def _save_post_impl(self, post_url: str) -> bool:
         """Internal implementation of saving a post."""
-        try:
-            submission = self.reddit.submission(url=post_url)
-            submission.save()
-            print(f"✅ Successfully saved post: {submission.title}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error saving post: {e}")
-            return False
+        submission = self._submission(post_url)
+        submission.save()
+        log.info(f"✅ Successfully saved post: {post_url}")
+        return True
     
     def unsave_post(self, post_url: str) -> bool:
         """Unsave a Reddit post."""
@@ -695,17 +1314,13 @@ class RedditCLI:
             post_url
         ) or False
     
+    @_safe(False, "unsaving post")
     def _unsave_post_impl(self, post_url: str) -> bool:
         """Internal implementation of unsaving a post."""
-        try:
-            submission = self.reddit.submission(url=post_url)
-            submission.unsave()
-            print(f"✅ Successfully unsaved post: {submission.title}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error unsaving post: {e}")
-            return False
+        submission = self._submission(post_url)
+        submission.unsave()
+        log.info(f"✅ Successfully unsaved post: {post_url}")
+        return True
     
     def get_saved_posts(self, limit: int = 10) -> List[Dict]:
         """Get user's saved posts."""
@@ -714,27 +1329,27 @@ class RedditCLI:
             limit
         ) or []
     
+    @_safe([], "getting saved posts")
     def _get_saved_posts_impl(self, limit: int = 10) -> List[Dict]:
         """Internal implementation of getting saved posts."""
-        try:
-            saved_posts = []
-            
-            for submission in self.reddit.user.me().saved(limit=limit):
-                saved_posts.append({
-                    'id': submission.id,
-                    'title': submission.title,
-                    'subreddit': str(submission.subreddit),
-                    'score': submission.score,
-                    'num_comments': submission.num_comments,
-                    'url': f"https://reddit.com{submission.permalink}",
-                    'created_utc': datetime.fromtimestamp(submission.created_utc).strftime('%Y-%m-%d %H:%M:%S')
-                })
-            
-            return saved_posts
-            
-        except Exception as e:
-            print(f"❌ Error getting saved posts: {e}")
-            return []
+        saved_posts = []
+        
+        for submission in _prefetch(self._me().saved(limit=limit), limit):
+            # Saved items can also be comments, which have no title
+            if not isinstance(submission, Submission):
+                continue
+            
+            saved_posts.append({
+                'id': submission.id,
+                'title': submission.title,
+                'subreddit': str(submission.subreddit),
+                'score': submission.score,
+                'num_comments': submission.num_comments,
+                'url': REDDIT_URL + submission.permalink,
+                'created_utc': int(submission.created_utc)
+            })
+        
+        return saved_posts
     
     def send_message(self, username: str, subject: str, body: str) -> bool:
         """Send a private message to a user."""
@@ -743,16 +1358,12 @@ class RedditCLI:
             username, subject, body
         ) or False
     
+    @_safe(False, "sending message")
     def _send_message_impl(self, username: str, subject: str, body: str) -> bool:
         """Internal implementation of sending a message."""
-        try:
-            self.reddit.redditor(username).message(subject, body)
-            print(f"✅ Successfully sent message to u/{username}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error sending message: {e}")
-            return False
+        self._redditor(username).message(subject, body)
+        log.info(f"✅ Successfully sent message to u/{username}")
+        return True
     
     def get_inbox(self, limit: int = 10) -> List[Dict]:
         """Get user's inbox messages."""
@@ -761,61 +1372,93 @@ class RedditCLI:
             limit
         ) or []
     
+    @_safe([], "getting inbox")
     def _get_inbox_impl(self, limit: int = 10) -> List[Dict]:
         """Internal implementation of getting inbox."""
-        try:
-            messages = []
-            
-            for message in self.reddit.inbox.unread(limit=limit):
-                messages.append({
-                    'id': message.id,
-                    'author': str(message.author) if message.author else '[deleted]',
-                    'subject': message.subject,
-                    'body': message.body[:200] + "..." if len(message.body) > 200 else message.body,
-                    'created_utc': datetime.fromtimestamp(message.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': f"https://reddit.com/message/messages/{message.id}"
-                })
-            
-            return messages
-            
-        except Exception as e:
-            print(f"❌ Error getting inbox: {e}")
-            return []
+        messages = []
+        
+        for message in self.reddit.inbox.unread(limit=limit):
+            messages.append({
+                'id': message.id,
+                'author': self._author_name(message),
+                'subject': message.subject,
+                'body': self._truncate(message.body),
+                'created_utc': int(message.created_utc),
+                'url': f"{REDDIT_URL}/message/messages/{message.id}"
+            })
+        
+        return messages
     
     def search_posts(self, query: str, subreddit: str = None, limit: int = 10) -> List[Dict]:
         """Search for posts across Reddit."""
-        return self._execute_with_retry(
-            self._search_posts_impl,
-            query, subreddit, limit
+        return self._cached(
+            ('search_posts', query, (subreddit or '').lower(), limit, self.fast),
+            lambda: self._execute_with_retry(self._search_posts_impl, query, subreddit, limit)
         ) or []
     
+    @_safe([], "searching posts")
     def _search_posts_impl(self, query: str, subreddit: str = None, limit: int = 10) -> List[Dict]:
         """Internal implementation of searching posts."""
-        try:
-            posts = []
-            
-            if subreddit:
-                search_target = self.reddit.subreddit(subreddit)
-            else:
-                search_target = self.reddit.subreddit("all")
-            
-            for submission in search_target.search(query, limit=limit):
+        if self.fast:
+            path = f"r/{subreddit}/search" if subreddit else "search"
+            return self._raw_submission_rows(path, limit, {'q': query, 'restrict_sr': bool(subreddit)})
+        
+        posts = []
+        
+        if subreddit:
+            search_target = self._sub(subreddit)
+        else:
+            search_target = self._sub("all")
+        
+        for submission in search_target.search(query, limit=limit):
+            posts.append({
+                'id': submission.id,
+                'title': submission.title,
+                'subreddit': str(submission.subreddit),
+                'score': submission.score,
+                'num_comments': submission.num_comments,
+                'url': REDDIT_URL + submission.permalink,
+                'created_utc': int(submission.created_utc),
+                'author': self._author_name(submission)
+            })
+        
+        return posts
+    
+    def _raw_submission_rows(self, path: str, limit: int, params: Dict = None) -> List[Dict]:
+        """Read a submission listing as plain JSON, skipping PRAW's model objects.
+        
+        Used with --fast. Pages are requested ``LISTING_PAGE_SIZE`` at a time
+        until ``limit`` rows are collected or the listing ends. Rows have the
+        same fields as the PRAW-built ones; callers still cache them under a
+        separate key, since the raw requests don't send every PRAW default.
+        """
+        posts = []
+        after = None
+        
+        while len(posts) < limit:
+            page_params = dict(params or {}, limit=min(LISTING_PAGE_SIZE, limit - len(posts)), raw_json=1)
+            if after:
+                page_params['after'] = after
+            listing = self.reddit.request(method="GET", path=path, params=page_params)['data']
+            
+            for child in listing['children']:
+                post = child['data']
                 posts.append({
-                    'id': submission.id,
-                    'title': submission.title,
-                    'subreddit': str(submission.subreddit),
-                    'score': submission.score,
-                    'num_comments': submission.num_comments,
-                    'url': f"https://reddit.com{submission.permalink}",
-                    'created_utc': datetime.fromtimestamp(submission.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                    'author': str(submission.author) if submission.author else '[deleted]'
+                    'id': post['id'],
+                    'title': post['title'],
+                    'subreddit': post['subreddit'],
+                    'score': post['score'],
+                    'num_comments': post['num_comments'],
+                    'url': REDDIT_URL + post['permalink'],
+                    'created_utc': int(post['created_utc']),
+                    'author': post.get('author') or '[deleted]'
                 })
             
-            return posts
-            
-        except Exception as e:
-            print(f"❌ Error searching posts: {e}")
-            return []
+            after = listing.get('after')
+            if not after or not listing['children']:
+                break
+        
+        return posts[:limit]
     
     def search_comments(self, query: str, subreddit: str = None, limit: int = 10) -> List[Dict]:
         """Search for comments across Reddit."""
@@ -824,36 +1467,55 @@ class RedditCLI:
             query, subreddit, limit
         ) or []
     
+    @_safe([], "searching comments")
     def _search_comments_impl(self, query: str, subreddit: str = None, limit: int = 10) -> List[Dict]:
         """Internal implementation of searching comments."""
-        try:
-            comments = []
-            
-            if subreddit:
-                search_target = self.reddit.subreddit(subreddit)
-            else:
-                search_target = self.reddit.subreddit("all")
-            
-            for comment in search_target.comments(limit=limit):
-                if query.lower() in comment.body.lower():
-                    comments.append({
-                        'id': comment.id,
-                        'body': comment.body[:200] + "..." if len(comment.body) > 200 else comment.body,
-                        'subreddit': str(comment.subreddit),
-                        'score': comment.score,
-                        'url': f"https://reddit.com{comment.permalink}",
-                        'created_utc': datetime.fromtimestamp(comment.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                        'author': str(comment.author) if comment.author else '[deleted]'
-                    })
-                    
-                    if len(comments) >= limit:
-                        break
-            
-            return comments
-            
-        except Exception as e:
-            print(f"❌ Error searching comments: {e}")
-            return []
+        comments = []
+        
+        # Let Reddit's search endpoint do the matching instead of scanning the
+        # latest comments and filtering them locally
+        path = f"r/{subreddit}/search" if subreddit else "search"
+        params = {'q': query, 'type': 'comment', 'sort': 'new', 'restrict_sr': bool(subreddit)}
+        
+        for comment in praw.models.ListingGenerator(self.reddit, path, limit=limit, params=params):
+            if not isinstance(comment, Comment):
+                # Search results without comment support; fall back to scanning
+                return self._scan_comments(query, subreddit, limit)
+            comments.append(self._comment_row(comment))
+        
+        if not comments:
+            # An ignored type=comment with no matching posts also comes back
+            # empty, so check the latest comments before reporting no matches
+            return self._scan_comments(query, subreddit, limit)
+        
+        return comments
+    
+    def _scan_comments(self, query: str, subreddit: str = None, limit: int = 10) -> List[Dict]:
+        """Find up to ``limit`` of the latest comments containing ``query``.
+        
+        Comments are scanned page by page until enough matches are found,
+        giving up after ``limit * COMMENT_SCAN_FACTOR`` comments.
+        """
+        # Case-insensitive match without building a lowercased copy of every body
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        max_scanned = limit * COMMENT_SCAN_FACTOR
+        latest = _prefetch(self._sub(subreddit or "all").comments(limit=max_scanned), max_scanned)
+        
+        matches = (c for c in latest if pattern.search(c.body))
+        return [self._comment_row(c) for c in itertools.islice(matches, limit)]
+    
+    @classmethod
+    def _comment_row(cls, comment: Comment) -> Dict:
+        """Build the search result entry for a comment."""
+        return {
+            'id': comment.id,
+            'body': cls._truncate(comment.body),
+            'subreddit': str(comment.subreddit),
+            'score': comment.score,
+            'url': REDDIT_URL + comment.permalink,
+            'created_utc': int(comment.created_utc),
+            'author': cls._author_name(comment)
+        }
     
     def edit_post(self, post_url: str, new_content: str) -> bool:
         """Edit a Reddit post."""
@@ -862,23 +1524,19 @@ class RedditCLI:
             post_url, new_content
         ) or False
     
+    @_safe(False, "editing post")
     def _edit_post_impl(self, post_url: str, new_content: str) -> bool:
         """Internal implementation of editing a post."""
-        try:
-            submission = self.reddit.submission(url=post_url)
-            
-            # Check if the post belongs to the current user
-            if submission.author != self.reddit.user.me():
-                print(f"❌ You can only edit your own posts")
-                return False
-            
-            submission.edit(new_content)
-            print(f"✅ Successfully edited post: {submission.title}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error editing post: {e}")
+        submission = self._submission(post_url)
+        
+        # Check if the post belongs to the current user
+        if not self._is_own(submission.author):
+            log.error(f"❌ You can only edit your own posts")
             return False
+        
+        submission.edit(new_content)
+        log.info(f"✅ Successfully edited post: {submission.title}")
+        return True
     
     def edit_comment(self, comment_url: str, new_content: str) -> bool:
         """Edit a Reddit comment."""
@@ -887,24 +1545,19 @@ class RedditCLI:
             comment_url, new_content
         ) or False
     
+    @_safe(False, "editing comment")
     def _edit_comment_impl(self, comment_url: str, new_content: str) -> bool:
         """Internal implementation of editing a comment."""
-        try:
-            comment_id = comment_url.split('/')[-1]
-            comment = self.reddit.comment(id=comment_id)
-            
-            # Check if the comment belongs to the current user
-            if comment.author != self.reddit.user.me():
-                print(f"❌ You can only edit your own comments")
-                return False
-            
-            comment.edit(new_content)
-            print(f"✅ Successfully edited comment")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error editing comment: {e}")
+        comment = self.reddit.comment(id=self._parse_comment_id(comment_url))
+        
+        # Check if the comment belongs to the current user
+        if not self._is_own(comment.author):
+            log.error(f"❌ You can only edit your own comments")
             return False
+        
+        comment.edit(new_content)
+        log.info(f"✅ Successfully edited comment")
+        return True
     
     def follow_user(self, username: str) -> bool:
         """Follow a Reddit user."""
@@ -913,17 +1566,13 @@ class RedditCLI:
             username
         ) or False
     
+    @_safe(False, "following user")
     def _follow_user_impl(self, username: str) -> bool:
         """Internal implementation of following a user."""
-        try:
-            user = self.reddit.redditor(username)
-            user.friend()
-            print(f"✅ Successfully followed u/{username}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error following user: {e}")
-            return False
+        user = self._redditor(username)
+        user.friend()
+        log.info(f"✅ Successfully followed u/{username}")
+        return True
     
     def unfollow_user(self, username: str) -> bool:
         """Unfollow a Reddit user."""
@@ -932,17 +1581,13 @@ class RedditCLI:
             username
         ) or False
     
+    @_safe(False, "unfollowing user")
     def _unfollow_user_impl(self, username: str) -> bool:
         """Internal implementation of unfollowing a user."""
-        try:
-            user = self.reddit.redditor(username)
-            user.unfriend()
-            print(f"✅ Successfully unfollowed u/{username}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error unfollowing user: {e}")
-            return False
+        user = self._redditor(username)
+        user.unfriend()
+        log.info(f"✅ Successfully unfollowed u/{username}")
+        return True
     
     def get_friends(self) -> List[Dict]:
         """Get user's friends list."""
@@ -950,576 +1595,1289 @@ class RedditCLI:
             self._get_friends_impl
         ) or []
     
+    @_safe([], "getting friends")
     def _get_friends_impl(self) -> List[Dict]:
         """Internal implementation of getting friends."""
-        try:
-            friends = []
-            
-            for friend in self.reddit.user.me().friends():
-                friends.append({
-                    'name': str(friend),
-                    'url': f"https://reddit.com/u/{friend}"
-                })
-            
-            return friends
-            
-        except Exception as e:
-            print(f"❌ Error getting friends: {e}")
-            return []
+        friends = []
+        
+        for friend in self._me().friends():
+            friends.append({
+                'name': str(friend),
+                'url': f"{REDDIT_URL}/u/{friend}"
+            })
+        
+        return friends
     
     def monitor_post(self, submission: Submission, check_interval: int = 30, 
-                    max_checks: int = 10) -> List[Dict]:
-        """Monitor a post for new responses."""
+                    max_checks: int = 10) -> Iterator[Dict]:
+        """Monitor a post for new responses, yielding each one as it arrives.
+        
+        New comments come from the subreddit's comment stream, so each check
+        only requests comments posted since the last one, reading further
+        pages only while the subreddit has more than a page waiting. The wait
+        between checks doubles while the post is quiet (up to 8x
+        ``check_interval``) and halves again once new responses show up.
+        Comments already on the post when monitoring starts are not reported;
+        the first check runs one interval after the start. Nothing is kept
+        between checks, so long monitors don't grow in memory.
+        """
         print(f"🔍 Monitoring post: {submission.title}")
-        print(f"⏰ Checking every {check_interval} seconds for {max_checks} times")
+        print(f"⏰ Checking about every {check_interval} seconds for {max_checks} times")
         
-        all_responses = []
-        seen_comment_ids = set()
+        interval = check_interval
+        floor = min(check_interval, max(5, check_interval // 4))
+        cap = check_interval * 8
+        # pause_after=-1 hands back None after every request. The stream asks
+        # only for comments newer than the last one it saw (Reddit's before=)
+        stream = submission.subreddit.stream.comments(skip_existing=True, pause_after=-1)
         
-        for check in range(max_checks):
-            print(f"\n📊 Check {check + 1}/{max_checks}")
-            
-            # Refresh the submission to get latest comments
-            submission.comments.replace_more(limit=0)
-            
-            new_responses = []
-            for comment in submission.comments:
-                if comment.id not in seen_comment_ids:
-                    seen_comment_ids.add(comment.id)
-                    response_data = {
-                        'author': str(comment.author) if comment.author else '[deleted]',
-                        'body': comment.body,
-                        'score': comment.score,
-                        'created_utc': datetime.fromtimestamp(comment.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                        'permalink': f"https://reddit.com{comment.permalink}"
-                    }
-                    new_responses.append(response_data)
-                    all_responses.append(response_data)
+        # The first request only marks where "new" starts (existing comments
+        # are skipped), so it isn't counted as a check and doesn't back off
+        for comment in stream:
+            if comment is None:
+                break
+        
+        for check in range(1, max_checks + 1):
+            if not self._sleep(interval):
+                break
+            print(f"\n📊 Check {check}/{max_checks}")
+            
+            found = 0
+            page = 0
+            for comment in stream:
+                if comment is None:
+                    if page < LISTING_PAGE_SIZE:
+                        break
+                    page = 0  # A full page means more are waiting, keep catching up
+                    continue
+                page += 1
+                if comment.link_id != submission.fullname:
+                    continue
+                found += 1
+                yield {
+                    'author': self._author_name(comment),
+                    'body': comment.body,
+                    'score': comment.score,
+                    'created_utc': int(comment.created_utc),
+                    'permalink': REDDIT_URL + comment.permalink
+                }
             
-            if new_responses:
-                print(f"🆕 Found {len(new_responses)} new responses:")
-                for response in new_responses:
-                    print(f"  👤 {response['author']}: {response['body'][:100]}...")
+            if found:
+                interval = max(floor, interval // 2)
             else:
                 print("📭 No new responses")
-            
-            if check < max_checks - 1:  # Don't sleep on the last check
-                time.sleep(check_interval)
-        
-        return all_responses
+                interval = min(cap, interval * 2)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="🚀 Reddit CLI - A comprehensive command-line interface for Reddit",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-🎯 QUICK START EXAMPLES:
+def format_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp as a UTC 'YYYY-MM-DD HH:MM:SS' string."""
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(timestamp))
 
-📝 Content Management:
-  %(prog)s post askreddit "What's your favorite programming language?" --content "I'm curious about what developers prefer and why."
-  %(prog)s comment "https://reddit.com/r/askreddit/comments/abc123/post/" "Great question! I think Python is excellent."
-  %(prog)s edit-post "https://reddit.com/r/askreddit/comments/abc123/post/" "Updated content"
 
-🔍 Discovery & Search:
-  %(prog)s search-subreddits "machine learning" --limit 10
-  %(prog)s search-posts "Python tutorial" --subreddit "learnpython" --limit 5
-  %(prog)s hot programming --limit 10
-  %(prog)s trending --limit 10
+def _orjson():
+    """Return the orjson module when it is installed, else None."""
+    try:
+        import orjson
+    except ImportError:  # Optional: faster JSON encoding and decoding
+        return None
+    return orjson
 
-👥 User Management:
-  %(prog)s user-profile "spez"
-  %(prog)s user-posts "username" --limit 10
-  %(prog)s follow "username"
-  %(prog)s friends
 
-🗳️ Voting & Engagement:
-  %(prog)s upvote "https://reddit.com/r/askreddit/comments/abc123/post/"
-  %(prog)s downvote "https://reddit.com/r/askreddit/comments/abc123/post/"
-  %(prog)s save "https://reddit.com/r/askreddit/comments/abc123/post/"
+def _dumps_json(data) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when it is installed."""
+    orjson = _orjson()
+    if orjson is None:
+        return json.dumps(data).encode('utf-8')
+    return orjson.dumps(data)
 
-📬 Messaging:
-  %(prog)s message "username" "Subject" "Message body"
-  %(prog)s inbox --limit 10
 
-🏷️ Subreddit Management:
-  %(prog)s flairs askreddit
-  %(prog)s subreddit-info "MachineLearning"
-  %(prog)s subscribe "MachineLearning"
-  %(prog)s moderators "MachineLearning"
+def _loads_json(data: bytes):
+    """Decode UTF-8 JSON, using orjson when it is installed."""
+    orjson = _orjson()
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
 
-📊 Monitoring:
-  %(prog)s responses "https://reddit.com/r/askreddit/comments/abc123/post/" --limit 20
-  %(prog)s monitor "https://reddit.com/r/askreddit/comments/abc123/post/" --interval 60
 
-💡 TIP: Use --help with any command for detailed options!
-        """
-    )
-    parser.add_argument("--config", default="reddit_config.json", help="Configuration file path")
+def write_json(data):
+    """Write data to stdout as JSON, using orjson when it is installed."""
+    orjson = _orjson()
+    if orjson is None:
+        sys.stdout.write(json.dumps(data) + "\n")
+        return
     
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    encoded = orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        # stdout has been redirected to a text stream (e.g. in the daemon)
+        sys.stdout.write(encoded.decode('utf-8'))
+    else:
+        sys.stdout.flush()
+        buffer.write(encoded)
+        buffer.flush()
+
+
+def write_lines(lines: List[str]):
+    """Write formatted lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _send_frame(sock: socket.socket, payload: Dict):
+    """Send a length-prefixed JSON message over a socket."""
+    data = _dumps_json(payload)
+    sock.sendall(struct.pack('!I', len(data)) + data)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Read exactly ``size`` bytes from a socket."""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("Connection closed before the message was complete")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv_frame(sock: socket.socket) -> Dict:
+    """Receive a length-prefixed JSON message from a socket."""
+    (size,) = struct.unpack('!I', _recv_exactly(sock, 4))
+    return _loads_json(_recv_exactly(sock, size))
+
+
+def _apply_session_args(cli: 'RedditCLI', args: argparse.Namespace, config_file: str = None) -> bool:
+    """Apply one command's global options to a long-lived RedditCLI.
+    
+    Returns False, after logging why, when the command asks for a different
+    config (another account) or for a daemon, which this session can't serve.
+    ``config_file`` overrides ``args.config`` when it was resolved elsewhere.
+    """
+    config_file = config_file or args.config
+    if args.daemon or os.path.abspath(config_file) != os.path.abspath(cli.config_file):
+        log.error("❌ --config and --daemon can't be changed inside a running session")
+        return False
+    
+    # Keep the authenticated user, but don't serve stale subreddit/user data
+    cli._clear_lookup_cache(include_me=False)
+    configure_logging(args.quiet, args.verbose)
+    cli.use_cache = not args.no_cache
+    cli.cache_ttl = args.cache_ttl
+    cli.fast = args.fast
+    return True
+
+
+def _run_daemon_request(cli: 'RedditCLI', argv: List[str], config_file: str) -> Dict:
+    """Run one forwarded command inside the daemon and capture its output.
+    
+    Output and log lines are captured separately so the client can keep
+    results on stdout and messages on stderr.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            args = build_parser(argv).parse_args(argv)
+            # The client's config was already matched against ours, as an absolute path
+            if not _apply_session_args(cli, args, config_file):
+                exit_code = 1
+            elif args.command:
+                try:
+                    run_command(cli, args)
+                finally:
+                    cli.finish_retry_stats()
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            log.error(f"❌ Error: {e}")
+            exit_code = 1
+    
+    return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+def serve_daemon(config_file: str, socket_path: str):
+    """Serve CLI commands over a Unix socket with one long-lived Reddit session."""
+    if not hasattr(socket, 'AF_UNIX'):
+        log.error("❌ Daemon mode requires Unix domain socket support")
+        sys.exit(1)
+    
+    cli = RedditCLI(config_file)
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    server.listen()
+    log.info(f"🚀 Daemon listening on {socket_path} (Ctrl+C to stop)")
+    
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    request = _recv_frame(conn)
+                    argv = request.get('argv', [])
+                    if request.get('config') != os.path.abspath(cli.config_file):
+                        # Never run a command as the daemon's account for another config
+                        _send_frame(conn, {'refused': "different --config"})
+                    elif _command_from_argv(argv) in LOCAL_COMMANDS:
+                        _send_frame(conn, {'refused': "command runs locally"})
+                    else:
+                        _send_frame(conn, _run_daemon_request(cli, argv, request['config']))
+                except (ConnectionError, ValueError, struct.error) as e:
+                    log.error(f"❌ Bad daemon request: {e}")
+    except KeyboardInterrupt:
+        log.info("👋 Daemon stopped")
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def call_daemon(socket_path: str, argv: List[str], config_file: str) -> Optional[int]:
+    """Forward a command to a running daemon.
+    
+    Returns the command's exit code, or None if no daemon is reachable or
+    the daemon was started with a different config file.
+    """
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return None
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            _send_frame(sock, {'argv': argv, 'config': os.path.abspath(config_file)})
+            response = _recv_frame(sock)
+    except (OSError, ValueError, struct.error):
+        return None
     
-    # Post command
+    if 'refused' in response:
+        log.debug(f"Daemon refused the command ({response['refused']}), running it directly")
+        return None
+    
+    sys.stderr.write(response.get('stderr', ''))
+    sys.stdout.write(response.get('stdout', ''))
+    return response.get('exit_code', 0)
+
+
+def run_repl(cli: 'RedditCLI'):
+    """Run commands read from stdin, one per line, with a single RedditCLI.
+    
+    Lines use the same syntax as the command line (without the program name).
+    Blank lines and lines starting with ``#`` are skipped; ``exit`` or
+    ``quit`` ends the session.
+    """
+    interactive = sys.stdin.isatty()
+    
+    while True:
+        try:
+            line = input("reddit> " if interactive else "")
+        except EOFError:
+            break
+        except KeyboardInterrupt:
+            print()
+            break
+        
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line in ("exit", "quit"):
+            break
+        
+        try:
+            argv = shlex.split(line)
+            args = build_parser(argv).parse_args(argv)
+            # Without its own --config, a line runs with the session's config
+            options = argv[:argv.index(args.command)] if args.command else argv
+            given = any(o == "--config" or o.startswith("--config=") for o in options)
+            if args.command == "repl" or not _apply_session_args(cli, args, None if given else cli.config_file):
+                continue
+            if args.command:
+                run_command(cli, args)
+        except SystemExit:
+            continue  # argparse already reported the problem or printed help
+        except RateLimitExceeded as e:
+            log.error(f"❌ {e}")
+        except ValueError as e:
+            log.error(f"❌ Could not parse command: {e}")
+        except KeyboardInterrupt:
+            print()
+            log.warning("⏹️  Command interrupted")
+            cli._shutdown.clear()  # batch() set it to stop its workers; let later commands wait again
+        except Exception as e:
+            log.error(f"❌ Error: {e}")
+
+
+# Global options that take a value, so their value is not mistaken for the command
+GLOBAL_VALUE_OPTIONS = ("--config", "--cache-ttl", "--socket")
+
+
+def _command_from_argv(argv: List[str]) -> Optional[str]:
+    """Find the subcommand name in ``argv`` without parsing it."""
+    tokens = iter(argv)
+    for token in tokens:
+        if token in GLOBAL_VALUE_OPTIONS:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return token
+    return None
+
+
+def _add_post_parser(subparsers):
     post_parser = subparsers.add_parser("post", help="📝 Post content to a subreddit (text or link posts)")
     post_parser.add_argument("subreddit", help="Subreddit name (without r/)")
     post_parser.add_argument("title", help="Post title")
     post_parser.add_argument("--content", help="Post content (for text posts)")
     post_parser.add_argument("--url", help="URL (for link posts)")
     post_parser.add_argument("--flair", help="Flair ID")
-    
-    # Get responses command
-    responses_parser = subparsers.add_parser("responses", help="💬 Get comments and responses for a post")
-    responses_parser.add_argument("post_url", help="Reddit post URL")
+    return post_parser
+
+
+def _add_responses_parser(subparsers):
+    responses_parser = subparsers.add_parser("responses", help="💬 Get comments and responses for one or more posts")
+    responses_parser.add_argument("post_url", nargs="+", help="Reddit post URL(s); several are fetched concurrently")
     responses_parser.add_argument("--limit", type=int, default=10, help="Number of responses to fetch")
-    
-    # Monitor command
+    return responses_parser
+
+
+def _add_monitor_parser(subparsers):
     monitor_parser = subparsers.add_parser("monitor", help="📊 Monitor a post for new responses over time")
     monitor_parser.add_argument("post_url", help="Reddit post URL")
-    monitor_parser.add_argument("--interval", type=int, default=30, help="Check interval in seconds")
-    monitor_parser.add_argument("--max-checks", type=int, default=10, help="Maximum number of checks")
-    
-    # Flairs command
+    monitor_parser.add_argument("--interval", type=int, default=30,
+                                help="Base check interval in seconds; the first check runs one interval after start "
+                                     "(backs off while the post is quiet)")
+    monitor_parser.add_argument("--max-checks", type=int, default=10,
+                                help="Maximum number of checks for comments posted after monitoring started")
+    return monitor_parser
+
+
+def _add_flairs_parser(subparsers):
     flairs_parser = subparsers.add_parser("flairs", help="🏷️ Get available flairs for a subreddit")
-    flairs_parser.add_argument("subreddit", help="Subreddit name (without r/)")
-    
-    # Delete command
+    flairs_parser.add_argument("subreddit", nargs="+", help="Subreddit name(s) (without r/)")
+    return flairs_parser
+
+
+def _add_delete_parser(subparsers):
     delete_parser = subparsers.add_parser("delete", help="🗑️ Delete a post (only your own posts)")
     delete_parser.add_argument("post_url", help="Reddit post URL")
-    
-    # Comment command
+    return delete_parser
+
+
+def _add_comment_parser(subparsers):
     comment_parser = subparsers.add_parser("comment", help="💬 Comment on a Reddit post")
     comment_parser.add_argument("post_url", help="Reddit post URL")
     comment_parser.add_argument("text", help="Comment text")
-    
-    # Reply command
+    return comment_parser
+
+
+def _add_reply_parser(subparsers):
     reply_parser = subparsers.add_parser("reply", help="↩️ Reply to a Reddit comment")
     reply_parser.add_argument("comment_url", help="Reddit comment URL")
     reply_parser.add_argument("text", help="Reply text")
-    
-    # Hot posts command
-    hot_parser = subparsers.add_parser("hot", help="🔥 Get hot/trending posts from a subreddit")
-    hot_parser.add_argument("subreddit", help="Subreddit name (without r/)")
+    return reply_parser
+
+
+def _add_hot_parser(subparsers):
+    hot_parser = subparsers.add_parser("hot", help="🔥 Get hot/trending posts from one or more subreddits")
+    hot_parser.add_argument("subreddit", nargs="+",
+                            help="Subreddit name(s) (without r/); several are merged into one listing")
     hot_parser.add_argument("--limit", type=int, default=10, help="Number of posts to fetch")
-    
-    # Search subreddits command
+    hot_parser.add_argument("--per-subreddit", action="store_true",
+                            help="Fetch up to --limit posts from each subreddit, still in one request")
+    return hot_parser
+
+
+def _add_search_subreddits_parser(subparsers):
     search_parser = subparsers.add_parser("search-subreddits", help="🔍 Search for subreddits by keywords")
     search_parser.add_argument("query", help="Search query")
     search_parser.add_argument("--limit", type=int, default=10, help="Number of subreddits to fetch")
-    
-    # Subreddit info command
+    return search_parser
+
+
+def _add_subreddit_info_parser(subparsers):
     info_parser = subparsers.add_parser("subreddit-info", help="ℹ️ Get detailed information about a subreddit")
     info_parser.add_argument("subreddit", help="Subreddit name (without r/)")
-    
-    # Subscribe command
+    return info_parser
+
+
+def _add_subreddit_overview_parser(subparsers):
+    overview_parser = subparsers.add_parser("subreddit-overview", help="🧭 Get subreddit info, moderators and hot posts in one go")
+    overview_parser.add_argument("subreddit", help="Subreddit name (without r/)")
+    overview_parser.add_argument("--limit", type=int, default=10, help="Number of hot posts to fetch")
+    return overview_parser
+
+
+def _add_subscribe_parser(subparsers):
     subscribe_parser = subparsers.add_parser("subscribe", help="➕ Subscribe to a subreddit")
     subscribe_parser.add_argument("subreddit", help="Subreddit name (without r/)")
-    
-    # Unsubscribe command
+    return subscribe_parser
+
+
+def _add_unsubscribe_parser(subparsers):
     unsubscribe_parser = subparsers.add_parser("unsubscribe", help="➖ Unsubscribe from a subreddit")
     unsubscribe_parser.add_argument("subreddit", help="Subreddit name (without r/)")
-    
-    # Trending subreddits command
+    return unsubscribe_parser
+
+
+def _add_trending_parser(subparsers):
     trending_parser = subparsers.add_parser("trending", help="📈 Get trending subreddits across Reddit")
     trending_parser.add_argument("--limit", type=int, default=10, help="Number of subreddits to fetch")
-    
-    # Moderators command
+    return trending_parser
+
+
+def _add_moderators_parser(subparsers):
     moderators_parser = subparsers.add_parser("moderators", help="👮 Get moderators of a subreddit")
     moderators_parser.add_argument("subreddit", help="Subreddit name (without r/)")
-    
-    # Voting commands
+    return moderators_parser
+
+
+def _add_upvote_parser(subparsers):
     upvote_parser = subparsers.add_parser("upvote", help="⬆️ Upvote a post or comment")
     upvote_parser.add_argument("url", help="Post or comment URL")
-    
+    return upvote_parser
+
+
+def _add_downvote_parser(subparsers):
     downvote_parser = subparsers.add_parser("downvote", help="⬇️ Downvote a post or comment")
     downvote_parser.add_argument("url", help="Post or comment URL")
-    
-    # User management commands
+    return downvote_parser
+
+
+def _add_user_profile_parser(subparsers):
     user_profile_parser = subparsers.add_parser("user-profile", help="👤 Get user profile information")
     user_profile_parser.add_argument("username", help="Reddit username")
-    
+    return user_profile_parser
+
+
+def _add_user_posts_parser(subparsers):
     user_posts_parser = subparsers.add_parser("user-posts", help="📝 Get posts by a user")
     user_posts_parser.add_argument("username", help="Reddit username")
     user_posts_parser.add_argument("--limit", type=int, default=10, help="Number of posts to fetch")
-    
+    return user_posts_parser
+
+
+def _add_user_dump_parser(subparsers):
+    user_dump_parser = subparsers.add_parser("user-dump", help="🗂️ Get a user's profile, posts and comments in one go")
+    user_dump_parser.add_argument("username", help="Reddit username")
+    user_dump_parser.add_argument("--limit", type=int, default=10, help="Number of posts and comments to fetch")
+    return user_dump_parser
+
+
+def _add_user_comments_parser(subparsers):
     user_comments_parser = subparsers.add_parser("user-comments", help="💬 Get comments by a user")
     user_comments_parser.add_argument("username", help="Reddit username")
     user_comments_parser.add_argument("--limit", type=int, default=10, help="Number of comments to fetch")
-    
-    # Content management commands
+    return user_comments_parser
+
+
+def _add_save_parser(subparsers):
     save_parser = subparsers.add_parser("save", help="💾 Save a post for later")
     save_parser.add_argument("post_url", help="Reddit post URL")
-    
+    return save_parser
+
+
+def _add_unsave_parser(subparsers):
     unsave_parser = subparsers.add_parser("unsave", help="🗑️ Unsave a post")
     unsave_parser.add_argument("post_url", help="Reddit post URL")
-    
+    return unsave_parser
+
+
+def _add_saved_posts_parser(subparsers):
     saved_posts_parser = subparsers.add_parser("saved-posts", help="📚 Get user's saved posts")
     saved_posts_parser.add_argument("--limit", type=int, default=10, help="Number of posts to fetch")
-    
-    # Messaging commands
+    return saved_posts_parser
+
+
+def _add_message_parser(subparsers):
     message_parser = subparsers.add_parser("message", help="📬 Send a private message")
     message_parser.add_argument("username", help="Recipient username")
     message_parser.add_argument("subject", help="Message subject")
     message_parser.add_argument("body", help="Message body")
-    
+    return message_parser
+
+
+def _add_inbox_parser(subparsers):
     inbox_parser = subparsers.add_parser("inbox", help="📥 Get inbox messages")
     inbox_parser.add_argument("--limit", type=int, default=10, help="Number of messages to fetch")
-    
-    # Search commands
+    return inbox_parser
+
+
+def _add_search_posts_parser(subparsers):
     search_posts_parser = subparsers.add_parser("search-posts", help="🔍 Search for posts across Reddit")
     search_posts_parser.add_argument("query", help="Search query")
     search_posts_parser.add_argument("--subreddit", help="Subreddit to search in")
     search_posts_parser.add_argument("--limit", type=int, default=10, help="Number of posts to fetch")
-    
+    return search_posts_parser
+
+
+def _add_search_comments_parser(subparsers):
     search_comments_parser = subparsers.add_parser("search-comments", help="🔍 Search for comments across Reddit")
     search_comments_parser.add_argument("query", help="Search query")
     search_comments_parser.add_argument("--subreddit", help="Subreddit to search in")
     search_comments_parser.add_argument("--limit", type=int, default=10, help="Number of comments to fetch")
-    
-    # Editing commands
+    return search_comments_parser
+
+
+def _add_edit_post_parser(subparsers):
     edit_post_parser = subparsers.add_parser("edit-post", help="✏️ Edit a post (only your own posts)")
     edit_post_parser.add_argument("post_url", help="Reddit post URL")
     edit_post_parser.add_argument("new_content", help="New post content")
-    
+    return edit_post_parser
+
+
+def _add_edit_comment_parser(subparsers):
     edit_comment_parser = subparsers.add_parser("edit-comment", help="✏️ Edit a comment (only your own comments)")
     edit_comment_parser.add_argument("comment_url", help="Reddit comment URL")
     edit_comment_parser.add_argument("new_content", help="New comment content")
-    
-    # User relationships commands
+    return edit_comment_parser
+
+
+def _add_follow_parser(subparsers):
     follow_parser = subparsers.add_parser("follow", help="➕ Follow a user")
     follow_parser.add_argument("username", help="Reddit username")
-    
+    return follow_parser
+
+
+def _add_unfollow_parser(subparsers):
     unfollow_parser = subparsers.add_parser("unfollow", help="➖ Unfollow a user")
     unfollow_parser.add_argument("username", help="Reddit username")
-    
+    return unfollow_parser
+
+
+def _add_friends_parser(subparsers):
     friends_parser = subparsers.add_parser("friends", help="👥 Get friends list")
+    return friends_parser
+
+
+def _add_repl_parser(subparsers):
+    repl_parser = subparsers.add_parser("repl", help="⌨️ Read commands from stdin and run them over one Reddit session")
+    return repl_parser
+
+
+# Commands that always run in this process instead of a daemon: the REPL
+# reads this terminal, and a monitor would hold the daemon for its whole run
+LOCAL_COMMANDS = ("repl", "monitor")
+
+
+# Subcommand name -> function adding its parser, in help order
+SUBCOMMANDS = {
+    "post": _add_post_parser,
+    "responses": _add_responses_parser,
+    "monitor": _add_monitor_parser,
+    "flairs": _add_flairs_parser,
+    "delete": _add_delete_parser,
+    "comment": _add_comment_parser,
+    "reply": _add_reply_parser,
+    "hot": _add_hot_parser,
+    "search-subreddits": _add_search_subreddits_parser,
+    "subreddit-info": _add_subreddit_info_parser,
+    "subreddit-overview": _add_subreddit_overview_parser,
+    "subscribe": _add_subscribe_parser,
+    "unsubscribe": _add_unsubscribe_parser,
+    "trending": _add_trending_parser,
+    "moderators": _add_moderators_parser,
+    "upvote": _add_upvote_parser,
+    "downvote": _add_downvote_parser,
+    "user-profile": _add_user_profile_parser,
+    "user-posts": _add_user_posts_parser,
+    "user-comments": _add_user_comments_parser,
+    "user-dump": _add_user_dump_parser,
+    "save": _add_save_parser,
+    "unsave": _add_unsave_parser,
+    "saved-posts": _add_saved_posts_parser,
+    "message": _add_message_parser,
+    "inbox": _add_inbox_parser,
+    "search-posts": _add_search_posts_parser,
+    "search-comments": _add_search_comments_parser,
+    "edit-post": _add_edit_post_parser,
+    "edit-comment": _add_edit_comment_parser,
+    "follow": _add_follow_parser,
+    "unfollow": _add_unfollow_parser,
+    "friends": _add_friends_parser,
+    "repl": _add_repl_parser,
+}
+
+
+# Commands whose results can be written as JSON with --json
+JSON_COMMANDS = (
+    "responses", "flairs", "hot", "search-subreddits", "subreddit-info", "subreddit-overview",
+    "trending", "moderators", "user-profile", "user-posts", "user-comments", "user-dump", "saved-posts",
+    "inbox", "search-posts", "search-comments", "friends",
+)
+
+
+def build_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Build the command-line argument parser.
     
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return
-    
-    cli = RedditCLI(args.config)
-    
-    if args.command == "post":
-        submission = cli.post_to_subreddit(
-            args.subreddit, 
-            args.title, 
-            args.content, 
-            args.url, 
-            args.flair
-        )
-        
-        if submission:
-            print(f"\n📊 Post Stats:")
-            print(f"  🔗 URL: https://reddit.com{submission.permalink}")
-            print(f"  📈 Score: {submission.score}")
-            print(f"  💬 Comments: {submission.num_comments}")
-    
-    elif args.command == "responses":
-        submission = cli.get_post_by_url(args.post_url)
-        if submission:
-            responses = cli.get_post_responses(submission, args.limit)
-            print(f"\n💬 Found {len(responses)} responses:")
-            for i, response in enumerate(responses, 1):
-                print(f"\n{i}. 👤 {response['author']} (Score: {response['score']})")
-                print(f"   📅 {response['created_utc']}")
-                print(f"   💭 {response['body']}")
-                print(f"   🔗 {response['permalink']}")
-    
-    elif args.command == "monitor":
-        submission = cli.get_post_by_url(args.post_url)
-        if submission:
-            responses = cli.monitor_post(submission, args.interval, args.max_checks)
-            print(f"\n📊 Total responses collected: {len(responses)}")
-    
-    elif args.command == "flairs":
-        flairs = cli.get_subreddit_flairs(args.subreddit)
-        if flairs:
-            print(f"\n🏷️  Available flairs for r/{args.subreddit}:")
-            for flair in flairs:
-                print(f"  ID: {flair['id']} | Text: {flair['text']} | CSS: {flair['css_class']}")
-        else:
-            print(f"No flairs available for r/{args.subreddit}")
-    
-    elif args.command == "delete":
-        success = cli.delete_post(args.post_url)
-        if success:
-            print(f"\n🗑️  Post successfully deleted!")
-        else:
-            print(f"\n❌ Failed to delete post")
-    
-    elif args.command == "comment":
-        comment = cli.comment_on_post(args.post_url, args.text)
-        if comment:
-            print(f"\n💬 Comment successfully posted!")
-        else:
-            print(f"\n❌ Failed to post comment")
-    
-    elif args.command == "reply":
-        reply = cli.reply_to_comment(args.comment_url, args.text)
-        if reply:
-            print(f"\n💬 Reply successfully posted!")
-        else:
-            print(f"\n❌ Failed to post reply")
-    
-    elif args.command == "hot":
-        posts = cli.get_hot_posts(args.subreddit, args.limit)
-        if posts:
-            print(f"\n🔥 Hot posts from r/{args.subreddit}:")
-            for i, post in enumerate(posts, 1):
-                print(f"\n{i}. 📝 {post['title']}")
-                print(f"   👤 by {post['author']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
-                print(f"   📅 {post['created_utc']}")
-                print(f"   🔗 {post['url']}")
-        else:
-            print(f"No hot posts found for r/{args.subreddit}")
-    
-    elif args.command == "search-subreddits":
-        subreddits = cli.search_subreddits(args.query, args.limit)
-        if subreddits:
-            print(f"\n🔍 Subreddits matching '{args.query}':")
-            for i, subreddit in enumerate(subreddits, 1):
-                print(f"\n{i}. 📍 r/{subreddit['name']}")
-                print(f"   📝 {subreddit['title']}")
-                print(f"   📄 {subreddit['description']}")
-                print(f"   👥 {subreddit['subscribers']:,} subscribers | 🔥 {subreddit['active_users']} active")
-                print(f"   🔗 {subreddit['url']}")
-                if subreddit['nsfw']:
-                    print(f"   ⚠️  NSFW")
-        else:
-            print(f"No subreddits found matching '{args.query}'")
-    
-    elif args.command == "subreddit-info":
-        info = cli.get_subreddit_info(args.subreddit)
-        if info:
-            print(f"\n📊 Information about r/{args.subreddit}:")
-            print(f"   📝 Title: {info['title']}")
-            print(f"   📄 Description: {info['description']}")
-            print(f"   📄 Public Description: {info['public_description']}")
-            print(f"   👥 Subscribers: {info['subscribers']:,}")
-            print(f"   🔥 Active Users: {info['active_users']}")
-            print(f"   📅 Created: {info['created_utc']}")
-            print(f"   🔗 URL: {info['url']}")
-            print(f"   📝 Submission Type: {info['submission_type']}")
-            print(f"   🌐 Language: {info['lang']}")
-            if info['nsfw']:
-                print(f"   ⚠️  NSFW: Yes")
-            if info['quarantine']:
-                print(f"   🚫 Quarantined: Yes")
-        else:
-            print(f"Could not get information for r/{args.subreddit}")
-    
-    elif args.command == "subscribe":
-        success = cli.subscribe_to_subreddit(args.subreddit)
-        if success:
-            print(f"\n✅ Successfully subscribed to r/{args.subreddit}!")
-        else:
-            print(f"\n❌ Failed to subscribe to r/{args.subreddit}")
-    
-    elif args.command == "unsubscribe":
-        success = cli.unsubscribe_from_subreddit(args.subreddit)
-        if success:
-            print(f"\n✅ Successfully unsubscribed from r/{args.subreddit}!")
-        else:
-            print(f"\n❌ Failed to unsubscribe from r/{args.subreddit}")
-    
-    elif args.command == "trending":
-        subreddits = cli.get_trending_subreddits(args.limit)
-        if subreddits:
-            print(f"\n🔥 Trending Subreddits:")
-            for i, subreddit in enumerate(subreddits, 1):
-                print(f"\n{i}. 📍 r/{subreddit['name']}")
-                print(f"   📝 {subreddit['title']}")
-                print(f"   📄 {subreddit['description']}")
-                print(f"   👥 {subreddit['subscribers']:,} subscribers | 🔥 {subreddit['active_users']} active")
-                print(f"   🔗 {subreddit['url']}")
-                if subreddit['nsfw']:
-                    print(f"   ⚠️  NSFW")
-        else:
-            print(f"No trending subreddits found")
-    
-    elif args.command == "moderators":
-        moderators = cli.get_subreddit_moderators(args.subreddit)
-        if moderators:
-            print(f"\n👮 Moderators of r/{args.subreddit}:")
-            for i, moderator in enumerate(moderators, 1):
-                print(f"   {i}. 👤 u/{moderator['name']}")
-                print(f"      🔗 {moderator['url']}")
-        else:
-            print(f"No moderators found for r/{args.subreddit}")
-    
-    elif args.command == "upvote":
-        if "comment" in args.url:
-            success = cli.upvote_comment(args.url)
-        else:
-            success = cli.upvote_post(args.url)
-        if success:
-            print(f"\n✅ Successfully upvoted!")
-        else:
-            print(f"\n❌ Failed to upvote")
-    
-    elif args.command == "downvote":
-        if "comment" in args.url:
-            success = cli.downvote_comment(args.url)
-        else:
-            success = cli.downvote_post(args.url)
-        if success:
-            print(f"\n✅ Successfully downvoted!")
-        else:
-            print(f"\n❌ Failed to downvote")
-    
-    elif args.command == "user-profile":
-        profile = cli.get_user_profile(args.username)
-        if profile:
-            print(f"\n👤 Profile of u/{args.username}:")
-            print(f"   📅 Created: {profile['created_utc']}")
-            print(f"   💬 Comment Karma: {profile['comment_karma']:,}")
-            print(f"   🔗 Link Karma: {profile['link_karma']:,}")
-            print(f"   🏆 Total Karma: {profile['comment_karma'] + profile['link_karma']:,}")
-            print(f"   🔗 URL: {profile['url']}")
-            if profile['is_employee']:
-                print(f"   👨‍💼 Reddit Employee: Yes")
-            if profile['is_mod']:
-                print(f"   👮 Moderator: Yes")
-            if profile['is_gold']:
-                print(f"   🥇 Reddit Gold: Yes")
-        else:
-            print(f"Could not get profile for u/{args.username}")
-    
-    elif args.command == "user-posts":
-        posts = cli.get_user_posts(args.username, args.limit)
-        if posts:
-            print(f"\n📝 Posts by u/{args.username}:")
-            for i, post in enumerate(posts, 1):
-                print(f"\n{i}. 📝 {post['title']}")
-                print(f"   📍 r/{post['subreddit']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
-                print(f"   📅 {post['created_utc']}")
-                print(f"   🔗 {post['url']}")
-        else:
-            print(f"No posts found for u/{args.username}")
-    
-    elif args.command == "user-comments":
-        comments = cli.get_user_comments(args.username, args.limit)
-        if comments:
-            print(f"\n💬 Comments by u/{args.username}:")
-            for i, comment in enumerate(comments, 1):
-                print(f"\n{i}. 💬 {comment['body']}")
-                print(f"   📍 r/{comment['subreddit']} | 📈 {comment['score']}")
-                print(f"   📅 {comment['created_utc']}")
-                print(f"   🔗 {comment['url']}")
-        else:
-            print(f"No comments found for u/{args.username}")
+    When ``argv`` names a known subcommand, only that subcommand's parser is
+    registered, which keeps startup cheap.
+    """
+    parser = argparse.ArgumentParser(
+        description="🚀 Reddit CLI - A comprehensive command-line interface for Reddit",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+🎯 QUICK START EXAMPLES:
+
+📝 Content Management:
+  %(prog)s post askreddit "What's your favorite programming language?" --content "I'm curious about what developers prefer and why."
+  %(prog)s comment "https://reddit.com/r/askreddit/comments/abc123/post/" "Great question! I think Python is excellent."
+  %(prog)s edit-post "https://reddit.com/r/askreddit/comments/abc123/post/" "Updated content"
+
+🔍 Discovery & Search:
+  %(prog)s search-subreddits "machine learning" --limit 10
+  %(prog)s search-posts "Python tutorial" --subreddit "learnpython" --limit 5
+  %(prog)s hot programming --limit 10
+  %(prog)s trending --limit 10
+
+👥 User Management:
+  %(prog)s user-profile "spez"
+  %(prog)s user-posts "username" --limit 10
+  %(prog)s user-dump "username" --limit 5
+  %(prog)s follow "username"
+  %(prog)s friends
+
+🗳️ Voting & Engagement:
+  %(prog)s upvote "https://reddit.com/r/askreddit/comments/abc123/post/"
+  %(prog)s downvote "https://reddit.com/r/askreddit/comments/abc123/post/"
+  %(prog)s save "https://reddit.com/r/askreddit/comments/abc123/post/"
+
+📬 Messaging:
+  %(prog)s message "username" "Subject" "Message body"
+  %(prog)s inbox --limit 10
+
+🏷️ Subreddit Management:
+  %(prog)s flairs askreddit
+  %(prog)s subreddit-info "MachineLearning"
+  %(prog)s subreddit-overview "MachineLearning" --limit 5
+  %(prog)s subscribe "MachineLearning"
+  %(prog)s moderators "MachineLearning"
+
+📊 Monitoring:
+  %(prog)s responses "https://reddit.com/r/askreddit/comments/abc123/post/" --limit 20
+  %(prog)s monitor "https://reddit.com/r/askreddit/comments/abc123/post/" --interval 60
+
+⌨️ Scripting:
+  printf 'hot python --limit 5\ninbox\n' | %(prog)s repl
+
+💡 TIP: Use --help with any command for detailed options!
+        """
+    )
+    parser.add_argument("--config", default="reddit_config.json", help="Configuration file path")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="Only show errors on stderr")
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="Show debug messages on stderr")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always fetch fresh results instead of reusing recently cached ones")
+    parser.add_argument("--cache-ttl", type=float, default=RESPONSE_CACHE_TTL, metavar="SECONDS",
+                        help=f"How long read-only results are cached (default: {RESPONSE_CACHE_TTL})")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Run a background daemon that keeps one authenticated Reddit session open")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH,
+                        help="Unix socket path used to talk to the daemon")
+    parser.add_argument("--json", action="store_true",
+                        help="Output results as JSON (commands that return data)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Read hot, user-posts and search-posts listings as raw JSON without building PRAW objects")
     
-    elif args.command == "save":
-        success = cli.save_post(args.post_url)
-        if success:
-            print(f"\n✅ Post saved successfully!")
-        else:
-            print(f"\n❌ Failed to save post")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    elif args.command == "unsave":
-        success = cli.unsave_post(args.post_url)
-        if success:
-            print(f"\n✅ Post unsaved successfully!")
-        else:
-            print(f"\n❌ Failed to unsave post")
-    
-    elif args.command == "saved-posts":
-        posts = cli.get_saved_posts(args.limit)
-        if posts:
-            print(f"\n💾 Your Saved Posts:")
-            for i, post in enumerate(posts, 1):
-                print(f"\n{i}. 📝 {post['title']}")
-                print(f"   📍 r/{post['subreddit']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
-                print(f"   📅 {post['created_utc']}")
-                print(f"   🔗 {post['url']}")
-        else:
-            print(f"No saved posts found")
+    command = _command_from_argv(argv) if argv is not None else None
+    if command in SUBCOMMANDS:
+        # Only the invoked subcommand needs a parser; help and errors get all of them
+        SUBCOMMANDS[command](subparsers)
+    else:
+        for add_parser in SUBCOMMANDS.values():
+            add_parser(subparsers)
+    
+    # Also accept --json after the command; SUPPRESS keeps the global value otherwise
+    for name in JSON_COMMANDS:
+        if name not in subparsers.choices:
+            continue
+        subparsers.choices[name].add_argument("--json", action="store_true", default=argparse.SUPPRESS,
+                                              help="Output results as JSON")
+    
+    return parser
+
+
+def print_hot_posts(subreddit_name: str, posts: List[Dict]):
+    """Print hot posts from a subreddit."""
+    if posts:
+        lines = [f"\n🔥 Hot posts from r/{subreddit_name}:"]
+        for i, post in enumerate(posts, 1):
+            lines.append(f"\n{i}. 📝 {post['title']}")
+            if "+" in subreddit_name:
+                lines.append(f"   📍 r/{post['subreddit']}")
+            lines.append(f"   👤 by {post['author']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
+            lines.append(f"   📅 {format_timestamp(post['created_utc'])}")
+            lines.append(f"   🔗 {post['url']}")
+        write_lines(lines)
+    else:
+        print(f"No hot posts found for r/{subreddit_name}")
+
+
+def print_subreddit_info(subreddit_name: str, info: Optional[Dict]):
+    """Print detailed information about a subreddit."""
+    if info:
+        print(f"\n📊 Information about r/{subreddit_name}:")
+        print(f"   📝 Title: {info['title']}")
+        print(f"   📄 Description: {info['description']}")
+        print(f"   📄 Public Description: {info['public_description']}")
+        print(f"   👥 Subscribers: {info['subscribers']:,}")
+        print(f"   🔥 Active Users: {info['active_users']}")
+        print(f"   📅 Created: {format_timestamp(info['created_utc'])}")
+        print(f"   🔗 URL: {info['url']}")
+        print(f"   📝 Submission Type: {info['submission_type']}")
+        print(f"   🌐 Language: {info['lang']}")
+        if info['nsfw']:
+            print(f"   ⚠️  NSFW: Yes")
+        if info['quarantine']:
+            print(f"   🚫 Quarantined: Yes")
+    else:
+        print(f"Could not get information for r/{subreddit_name}")
+
+
+def print_moderators(subreddit_name: str, moderators: List[Dict]):
+    """Print the moderators of a subreddit."""
+    if moderators:
+        lines = [f"\n👮 Moderators of r/{subreddit_name}:"]
+        for i, moderator in enumerate(moderators, 1):
+            lines.append(f"   {i}. 👤 u/{moderator['name']}")
+            lines.append(f"      🔗 {moderator['url']}")
+        write_lines(lines)
+    else:
+        print(f"No moderators found for r/{subreddit_name}")
+
+
+def print_responses(responses: List[Dict]):
+    """Print the responses to a post."""
+    lines = [f"\n💬 Found {len(responses)} responses:"]
+    for i, response in enumerate(responses, 1):
+        lines.append(f"\n{i}. 👤 {response['author']} (Score: {response['score']})")
+        lines.append(f"   📅 {format_timestamp(response['created_utc'])}")
+        lines.append(f"   💭 {response['body']}")
+        lines.append(f"   🔗 {response['permalink']}")
+    write_lines(lines)
+
+
+def print_user_profile(username: str, profile: Optional[Dict]):
+    """Print a user's profile."""
+    if profile:
+        print(f"\n👤 Profile of u/{username}:")
+        print(f"   📅 Created: {format_timestamp(profile['created_utc'])}")
+        print(f"   💬 Comment Karma: {profile['comment_karma']:,}")
+        print(f"   🔗 Link Karma: {profile['link_karma']:,}")
+        print(f"   🏆 Total Karma: {profile['comment_karma'] + profile['link_karma']:,}")
+        print(f"   🔗 URL: {profile['url']}")
+        if profile['is_employee']:
+            print(f"   👨‍💼 Reddit Employee: Yes")
+        if profile['is_mod']:
+            print(f"   👮 Moderator: Yes")
+        if profile['is_gold']:
+            print(f"   🥇 Reddit Gold: Yes")
+    else:
+        print(f"Could not get profile for u/{username}")
+
+
+def print_user_posts(username: str, posts: List[Dict]):
+    """Print posts by a user."""
+    if posts:
+        lines = [f"\n📝 Posts by u/{username}:"]
+        for i, post in enumerate(posts, 1):
+            lines.append(f"\n{i}. 📝 {post['title']}")
+            lines.append(f"   📍 r/{post['subreddit']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
+            lines.append(f"   📅 {format_timestamp(post['created_utc'])}")
+            lines.append(f"   🔗 {post['url']}")
+        write_lines(lines)
+    else:
+        print(f"No posts found for u/{username}")
+
+
+def print_user_comments(username: str, comments: List[Dict]):
+    """Print comments by a user."""
+    if comments:
+        lines = [f"\n💬 Comments by u/{username}:"]
+        for i, comment in enumerate(comments, 1):
+            lines.append(f"\n{i}. 💬 {comment['body']}")
+            lines.append(f"   📍 r/{comment['subreddit']} | 📈 {comment['score']}")
+            lines.append(f"   📅 {format_timestamp(comment['created_utc'])}")
+            lines.append(f"   🔗 {comment['url']}")
+        write_lines(lines)
+    else:
+        print(f"No comments found for u/{username}")
+
+
+def _run_post(cli: RedditCLI, args: argparse.Namespace):
+    submission = cli.post_to_subreddit(
+        args.subreddit, 
+        args.title, 
+        args.content, 
+        args.url, 
+        args.flair
+    )
     
-    elif args.command == "message":
-        success = cli.send_message(args.username, args.subject, args.body)
-        if success:
-            print(f"\n✅ Message sent successfully!")
+    if submission:
+        print(f"\n📊 Post Stats:")
+        print(f"  🔗 URL: {REDDIT_URL}{submission.permalink}")
+        print(f"  📈 Score: {submission.score}")
+        print(f"  💬 Comments: {submission.num_comments}")
+
+
+def _run_responses(cli: RedditCLI, args: argparse.Namespace):
+    posts = [(url, cli.get_post_by_url(url)) for url in args.post_url]
+    posts = [(url, submission) for url, submission in posts if submission]
+    # Each post's comments are a separate request, so fetch them side by side
+    results = cli.batch([
+        ('get_post_responses', (submission, args.limit), {})
+        for _, submission in posts
+    ])
+    if args.json:
+        if len(args.post_url) == 1:
+            write_json(results[0] if results else [])
         else:
-            print(f"\n❌ Failed to send message")
-    
-    elif args.command == "inbox":
-        messages = cli.get_inbox(args.limit)
-        if messages:
-            print(f"\n📬 Your Inbox:")
-            for i, message in enumerate(messages, 1):
-                print(f"\n{i}. 📧 {message['subject']}")
-                print(f"   👤 From: u/{message['author']}")
-                print(f"   💭 {message['body']}")
-                print(f"   📅 {message['created_utc']}")
-                print(f"   🔗 {message['url']}")
+            write_json({url: responses for (url, _), responses in zip(posts, results)})
+    else:
+        for (url, _), responses in zip(posts, results):
+            if len(args.post_url) > 1:
+                print(f"\n📝 {url}")
+            print_responses(responses)
+
+
+def _run_monitor(cli: RedditCLI, args: argparse.Namespace):
+    submission = cli.get_post_by_url(args.post_url)
+    if submission:
+        total = 0
+        try:
+            for response in cli.monitor_post(submission, args.interval, args.max_checks):
+                total += 1
+                print(f"  🆕 👤 {response['author']}: {cli._truncate(response['body'], 100)}")
+        except KeyboardInterrupt:
+            # Ctrl-C ends the wait between checks right away; keep what was found
+            print("\n⏹️  Monitoring stopped")
+        print(f"\n📊 Total responses collected: {total}")
+
+
+def _run_flairs(cli: RedditCLI, args: argparse.Namespace):
+    # Flair templates are per subreddit, so several are fetched side by side
+    results = cli.batch([
+        ('get_subreddit_flairs', (name,), {}) for name in args.subreddit
+    ])
+    if args.json:
+        if len(args.subreddit) == 1:
+            write_json(results[0])
         else:
-            print(f"No messages in inbox")
-    
-    elif args.command == "search-posts":
-        posts = cli.search_posts(args.query, args.subreddit, args.limit)
-        if posts:
-            search_scope = f"r/{args.subreddit}" if args.subreddit else "all of Reddit"
-            print(f"\n🔍 Posts matching '{args.query}' in {search_scope}:")
-            for i, post in enumerate(posts, 1):
-                print(f"\n{i}. 📝 {post['title']}")
-                print(f"   📍 r/{post['subreddit']} | 👤 u/{post['author']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
-                print(f"   📅 {post['created_utc']}")
-                print(f"   🔗 {post['url']}")
+            write_json(dict(zip(args.subreddit, results)))
+    else:
+        for name, flairs in zip(args.subreddit, results):
+            if flairs:
+                print(f"\n🏷️  Available flairs for r/{name}:")
+                for flair in flairs:
+                    print(f"  ID: {flair['id']} | Text: {flair['text']} | CSS: {flair['css_class']}")
+            else:
+                print(f"No flairs available for r/{name}")
+
+
+def _run_delete(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.delete_post(args.post_url)
+    if success:
+        print(f"\n🗑️  Post successfully deleted!")
+    else:
+        print(f"\n❌ Failed to delete post")
+
+
+def _run_comment(cli: RedditCLI, args: argparse.Namespace):
+    comment = cli.comment_on_post(args.post_url, args.text)
+    if comment:
+        print(f"\n💬 Comment successfully posted!")
+    else:
+        print(f"\n❌ Failed to post comment")
+
+
+def _run_reply(cli: RedditCLI, args: argparse.Namespace):
+    reply = cli.reply_to_comment(args.comment_url, args.text)
+    if reply:
+        print(f"\n💬 Reply successfully posted!")
+    else:
+        print(f"\n❌ Failed to post reply")
+
+
+def _run_hot(cli: RedditCLI, args: argparse.Namespace):
+    # Reddit serves several subreddits as one listing via r/one+two
+    subreddit_name = "+".join(args.subreddit)
+    if args.per_subreddit and len(args.subreddit) > 1:
+        buckets = cli.get_posts_from_subreddits(args.subreddit, args.limit)
+        if args.json:
+            write_json(buckets)
         else:
-            print(f"No posts found matching '{args.query}'")
-    
-    elif args.command == "search-comments":
-        comments = cli.search_comments(args.query, args.subreddit, args.limit)
-        if comments:
-            search_scope = f"r/{args.subreddit}" if args.subreddit else "all of Reddit"
-            print(f"\n🔍 Comments matching '{args.query}' in {search_scope}:")
-            for i, comment in enumerate(comments, 1):
-                print(f"\n{i}. 💬 {comment['body']}")
-                print(f"   📍 r/{comment['subreddit']} | 👤 u/{comment['author']} | 📈 {comment['score']}")
-                print(f"   📅 {comment['created_utc']}")
-                print(f"   🔗 {comment['url']}")
+            for name, posts in buckets.items():
+                print_hot_posts(name, posts)
+    else:
+        posts = cli.get_hot_posts(subreddit_name, args.limit)
+        if args.json:
+            write_json(posts)
         else:
-            print(f"No comments found matching '{args.query}'")
+            print_hot_posts(subreddit_name, posts)
+
+
+def _run_search_subreddits(cli: RedditCLI, args: argparse.Namespace):
+    subreddits = cli.search_subreddits(args.query, args.limit)
+    if args.json:
+        write_json(subreddits)
+    elif subreddits:
+        lines = [f"\n🔍 Subreddits matching '{args.query}':"]
+        for i, subreddit in enumerate(subreddits, 1):
+            lines.append(f"\n{i}. 📍 r/{subreddit['name']}")
+            lines.append(f"   📝 {subreddit['title']}")
+            lines.append(f"   📄 {subreddit['description']}")
+            lines.append(f"   👥 {subreddit['subscribers']:,} subscribers | 🔥 {subreddit['active_users']} active")
+            lines.append(f"   🔗 {subreddit['url']}")
+            if subreddit['nsfw']:
+                lines.append(f"   ⚠️  NSFW")
+        write_lines(lines)
+    else:
+        print(f"No subreddits found matching '{args.query}'")
+
+
+def _run_subreddit_info(cli: RedditCLI, args: argparse.Namespace):
+    info = cli.get_subreddit_info(args.subreddit)
+    if args.json:
+        write_json(info)
+    else:
+        print_subreddit_info(args.subreddit, info)
+
+
+def _run_subreddit_overview(cli: RedditCLI, args: argparse.Namespace):
+    info, moderators, posts = cli.batch([
+        ('get_subreddit_info', (args.subreddit,), {}),
+        ('get_subreddit_moderators', (args.subreddit,), {}),
+        ('get_hot_posts', (args.subreddit, args.limit), {})
+    ])
+    if args.json:
+        write_json({'info': info, 'moderators': moderators, 'hot_posts': posts})
+    else:
+        print_subreddit_info(args.subreddit, info)
+        print_moderators(args.subreddit, moderators)
+        print_hot_posts(args.subreddit, posts)
+
+
+def _run_subscribe(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.subscribe_to_subreddit(args.subreddit)
+    if success:
+        print(f"\n✅ Successfully subscribed to r/{args.subreddit}!")
+    else:
+        print(f"\n❌ Failed to subscribe to r/{args.subreddit}")
+
+
+def _run_unsubscribe(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.unsubscribe_from_subreddit(args.subreddit)
+    if success:
+        print(f"\n✅ Successfully unsubscribed from r/{args.subreddit}!")
+    else:
+        print(f"\n❌ Failed to unsubscribe from r/{args.subreddit}")
+
+
+def _run_trending(cli: RedditCLI, args: argparse.Namespace):
+    subreddits = cli.get_trending_subreddits(args.limit)
+    if args.json:
+        write_json(subreddits)
+    elif subreddits:
+        lines = [f"\n🔥 Trending Subreddits:"]
+        for i, subreddit in enumerate(subreddits, 1):
+            lines.append(f"\n{i}. 📍 r/{subreddit['name']}")
+            lines.append(f"   📝 {subreddit['title']}")
+            lines.append(f"   📄 {subreddit['description']}")
+            lines.append(f"   👥 {subreddit['subscribers']:,} subscribers | 🔥 {subreddit['active_users']} active")
+            lines.append(f"   🔗 {subreddit['url']}")
+            if subreddit['nsfw']:
+                lines.append(f"   ⚠️  NSFW")
+        write_lines(lines)
+    else:
+        print(f"No trending subreddits found")
+
+
+def _run_moderators(cli: RedditCLI, args: argparse.Namespace):
+    moderators = cli.get_subreddit_moderators(args.subreddit)
+    if args.json:
+        write_json(moderators)
+    else:
+        print_moderators(args.subreddit, moderators)
+
+
+def _run_upvote(cli: RedditCLI, args: argparse.Namespace):
+    if COMMENT_ID_PATTERN.search(args.url):
+        success = cli.upvote_comment(args.url)
+    else:
+        success = cli.upvote_post(args.url)
+    if success:
+        print(f"\n✅ Successfully upvoted!")
+    else:
+        print(f"\n❌ Failed to upvote")
+
+
+def _run_downvote(cli: RedditCLI, args: argparse.Namespace):
+    if COMMENT_ID_PATTERN.search(args.url):
+        success = cli.downvote_comment(args.url)
+    else:
+        success = cli.downvote_post(args.url)
+    if success:
+        print(f"\n✅ Successfully downvoted!")
+    else:
+        print(f"\n❌ Failed to downvote")
+
+
+def _run_user_profile(cli: RedditCLI, args: argparse.Namespace):
+    profile = cli.get_user_profile(args.username)
+    if args.json:
+        write_json(profile)
+    else:
+        print_user_profile(args.username, profile)
+
+
+def _run_user_posts(cli: RedditCLI, args: argparse.Namespace):
+    posts = cli.get_user_posts(args.username, args.limit)
+    if args.json:
+        write_json(posts)
+    else:
+        print_user_posts(args.username, posts)
+
+
+def _run_user_comments(cli: RedditCLI, args: argparse.Namespace):
+    comments = cli.get_user_comments(args.username, args.limit)
+    if args.json:
+        write_json(comments)
+    else:
+        print_user_comments(args.username, comments)
+
+
+def _run_user_dump(cli: RedditCLI, args: argparse.Namespace):
+    profile, posts, comments = cli.batch([
+        ('get_user_profile', (args.username,), {}),
+        ('get_user_posts', (args.username, args.limit), {}),
+        ('get_user_comments', (args.username, args.limit), {})
+    ])
+    if args.json:
+        write_json({'profile': profile, 'posts': posts, 'comments': comments})
+    else:
+        print_user_profile(args.username, profile)
+        print_user_posts(args.username, posts)
+        print_user_comments(args.username, comments)
+
+
+def _run_save(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.save_post(args.post_url)
+    if success:
+        print(f"\n✅ Post saved successfully!")
+    else:
+        print(f"\n❌ Failed to save post")
+
+
+def _run_unsave(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.unsave_post(args.post_url)
+    if success:
+        print(f"\n✅ Post unsaved successfully!")
+    else:
+        print(f"\n❌ Failed to unsave post")
+
+
+def _run_saved_posts(cli: RedditCLI, args: argparse.Namespace):
+    posts = cli.get_saved_posts(args.limit)
+    if args.json:
+        write_json(posts)
+    elif posts:
+        lines = [f"\n💾 Your Saved Posts:"]
+        for i, post in enumerate(posts, 1):
+            lines.append(f"\n{i}. 📝 {post['title']}")
+            lines.append(f"   📍 r/{post['subreddit']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
+            lines.append(f"   📅 {format_timestamp(post['created_utc'])}")
+            lines.append(f"   🔗 {post['url']}")
+        write_lines(lines)
+    else:
+        print(f"No saved posts found")
+
+
+def _run_message(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.send_message(args.username, args.subject, args.body)
+    if success:
+        print(f"\n✅ Message sent successfully!")
+    else:
+        print(f"\n❌ Failed to send message")
+
+
+def _run_inbox(cli: RedditCLI, args: argparse.Namespace):
+    messages = cli.get_inbox(args.limit)
+    if args.json:
+        write_json(messages)
+    elif messages:
+        lines = [f"\n📬 Your Inbox:"]
+        for i, message in enumerate(messages, 1):
+            lines.append(f"\n{i}. 📧 {message['subject']}")
+            lines.append(f"   👤 From: u/{message['author']}")
+            lines.append(f"   💭 {message['body']}")
+            lines.append(f"   📅 {format_timestamp(message['created_utc'])}")
+            lines.append(f"   🔗 {message['url']}")
+        write_lines(lines)
+    else:
+        print(f"No messages in inbox")
+
+
+def _run_search_posts(cli: RedditCLI, args: argparse.Namespace):
+    posts = cli.search_posts(args.query, args.subreddit, args.limit)
+    if args.json:
+        write_json(posts)
+    elif posts:
+        search_scope = f"r/{args.subreddit}" if args.subreddit else "all of Reddit"
+        lines = [f"\n🔍 Posts matching '{args.query}' in {search_scope}:"]
+        for i, post in enumerate(posts, 1):
+            lines.append(f"\n{i}. 📝 {post['title']}")
+            lines.append(f"   📍 r/{post['subreddit']} | 👤 u/{post['author']} | 📈 {post['score']} | 💬 {post['num_comments']} comments")
+            lines.append(f"   📅 {format_timestamp(post['created_utc'])}")
+            lines.append(f"   🔗 {post['url']}")
+        write_lines(lines)
+    else:
+        print(f"No posts found matching '{args.query}'")
+
+
+def _run_search_comments(cli: RedditCLI, args: argparse.Namespace):
+    comments = cli.search_comments(args.query, args.subreddit, args.limit)
+    if args.json:
+        write_json(comments)
+    elif comments:
+        search_scope = f"r/{args.subreddit}" if args.subreddit else "all of Reddit"
+        lines = [f"\n🔍 Comments matching '{args.query}' in {search_scope}:"]
+        for i, comment in enumerate(comments, 1):
+            lines.append(f"\n{i}. 💬 {comment['body']}")
+            lines.append(f"   📍 r/{comment['subreddit']} | 👤 u/{comment['author']} | 📈 {comment['score']}")
+            lines.append(f"   📅 {format_timestamp(comment['created_utc'])}")
+            lines.append(f"   🔗 {comment['url']}")
+        write_lines(lines)
+    else:
+        print(f"No comments found matching '{args.query}'")
+
+
+def _run_edit_post(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.edit_post(args.post_url, args.new_content)
+    if success:
+        print(f"\n✅ Post edited successfully!")
+    else:
+        print(f"\n❌ Failed to edit post")
+
+
+def _run_edit_comment(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.edit_comment(args.comment_url, args.new_content)
+    if success:
+        print(f"\n✅ Comment edited successfully!")
+    else:
+        print(f"\n❌ Failed to edit comment")
+
+
+def _run_follow(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.follow_user(args.username)
+    if success:
+        print(f"\n✅ Successfully followed u/{args.username}!")
+    else:
+        print(f"\n❌ Failed to follow u/{args.username}")
+
+
+def _run_unfollow(cli: RedditCLI, args: argparse.Namespace):
+    success = cli.unfollow_user(args.username)
+    if success:
+        print(f"\n✅ Successfully unfollowed u/{args.username}!")
+    else:
+        print(f"\n❌ Failed to unfollow u/{args.username}")
+
+
+def _run_friends(cli: RedditCLI, args: argparse.Namespace):
+    friends = cli.get_friends()
+    if args.json:
+        write_json(friends)
+    elif friends:
+        lines = [f"\n👥 Your Friends:"]
+        for i, friend in enumerate(friends, 1):
+            lines.append(f"   {i}. 👤 u/{friend['name']}")
+            lines.append(f"      🔗 {friend['url']}")
+        write_lines(lines)
+    else:
+        print(f"No friends found")
+
+
+# Command name -> function running it
+COMMAND_HANDLERS = {
+    "post": _run_post,
+    "responses": _run_responses,
+    "monitor": _run_monitor,
+    "flairs": _run_flairs,
+    "delete": _run_delete,
+    "comment": _run_comment,
+    "reply": _run_reply,
+    "hot": _run_hot,
+    "search-subreddits": _run_search_subreddits,
+    "subreddit-info": _run_subreddit_info,
+    "subreddit-overview": _run_subreddit_overview,
+    "subscribe": _run_subscribe,
+    "unsubscribe": _run_unsubscribe,
+    "trending": _run_trending,
+    "moderators": _run_moderators,
+    "upvote": _run_upvote,
+    "downvote": _run_downvote,
+    "user-profile": _run_user_profile,
+    "user-posts": _run_user_posts,
+    "user-comments": _run_user_comments,
+    "user-dump": _run_user_dump,
+    "save": _run_save,
+    "unsave": _run_unsave,
+    "saved-posts": _run_saved_posts,
+    "message": _run_message,
+    "inbox": _run_inbox,
+    "search-posts": _run_search_posts,
+    "search-comments": _run_search_comments,
+    "edit-post": _run_edit_post,
+    "edit-comment": _run_edit_comment,
+    "follow": _run_follow,
+    "unfollow": _run_unfollow,
+    "friends": _run_friends,
+}
+
+
+def run_command(cli: RedditCLI, args: argparse.Namespace):
+    """Run a parsed command against an initialized RedditCLI."""
+    handler = COMMAND_HANDLERS.get(args.command)
+    if handler:
+        handler(cli, args)
+
+
+def main():
+    parser = build_parser(sys.argv[1:])
+    args = parser.parse_args()
+    configure_logging(args.quiet, args.verbose)
     
-    elif args.command == "edit-post":
-        success = cli.edit_post(args.post_url, args.new_content)
-        if success:
-            print(f"\n✅ Post edited successfully!")
-        else:
-            print(f"\n❌ Failed to edit post")
+    if args.daemon:
+        serve_daemon(args.config, args.socket)
+        return
     
-    elif args.command == "edit-comment":
-        success = cli.edit_comment(args.comment_url, args.new_content)
-        if success:
-            print(f"\n✅ Comment edited successfully!")
-        else:
-            print(f"\n❌ Failed to edit comment")
+    if not args.command:
+        parser.print_help()
+        return
     
-    elif args.command == "follow":
-        success = cli.follow_user(args.username)
-        if success:
-            print(f"\n✅ Successfully followed u/{args.username}!")
-        else:
-            print(f"\n❌ Failed to follow u/{args.username}")
+    # Hand the command to a running daemon if there is one
+    if args.command not in LOCAL_COMMANDS:
+        exit_code = call_daemon(args.socket, sys.argv[1:], args.config)
+        if exit_code is not None:
+            sys.exit(exit_code)
     
-    elif args.command == "unfollow":
-        success = cli.unfollow_user(args.username)
-        if success:
-            print(f"\n✅ Successfully unfollowed u/{args.username}!")
-        else:
-            print(f"\n❌ Failed to unfollow u/{args.username}")
-    
-    elif args.command == "friends":
-        friends = cli.get_friends()
-        if friends:
-            print(f"\n👥 Your Friends:")
-            for i, friend in enumerate(friends, 1):
-                print(f"   {i}. 👤 u/{friend['name']}")
-                print(f"      🔗 {friend['url']}")
+    cli = RedditCLI(args.config, use_cache=not args.no_cache, cache_ttl=args.cache_ttl, fast=args.fast)
+    try:
+        if args.command == "repl":
+            run_repl(cli)
         else:
-            print(f"No friends found")
+            run_command(cli, args)
+    except RateLimitExceeded as e:
+        log.error(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        cli.finish_retry_stats()
 
 
 if __name__ == "__main__":